@@ -0,0 +1,88 @@
+"""
+Parse time and peak memory per HTML_PARSER tree builder, full tree vs the SoupStrainer-restricted parse,
+on the fixture pages in tests/fixtures/ (the scheme page is repeated to --scheme-plots plot cards).
+
+  python benchmarks/bench_parsers.py [--runs 5] [--scheme-plots 500]
+
+Peak memory is tracemalloc's peak for one parse + extraction: the BeautifulSoup tree is Python objects
+and is counted in full; lxml's transient libxml2 buffers are not.
+"""
+import argparse
+import logging
+import os
+import re
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import lambda_function as lf  # noqa: E402
+
+FIXTURES = os.path.join(ROOT, "tests", "fixtures")
+DETAIL_URL = f"{lf.BASE_URL}/Portal/AuctionListNew/Detail?unit=UITALW&type=live"
+SCHEME_URL = f"{lf.BASE_URL}/Portal/AuctionListNew/Scheme?unit=UITALW&scheme=101"
+
+PAGES = [
+    ("summary", "summary.html", lf._ONLY_SUMMARY, lf.build_unit_index),
+    ("unit detail", "unit_detail.html", lf._ONLY_SCHEMES, lambda soup: lf._parse_scheme_list(soup, DETAIL_URL)),
+    ("scheme", "scheme.html", lf._ONLY_PLOTS, lambda soup: lf._parse_plot_details(soup, SCHEME_URL)),
+    ("news", "auction_news.html", lf._ONLY_NEWS, lf._parse_newsletters),
+]
+
+
+def _read(name: str) -> str:
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def _scale_scheme(html: str, plots: int) -> str:
+    """Repeat the fixture's plot cards (with unique ids) until the page lists `plots` of them."""
+    cards = re.findall(r'<div class="plot-card">.*?</div>', html, re.S)
+    body = "".join(
+        cards[i % len(cards)].replace("UITALW-2026-", f"UITALW-{i:05d}-") for i in range(plots)
+    )
+    return html.replace("".join(re.findall(r'<div class="plot-card">.*?</div>\s*', html, re.S)), body)
+
+
+def _measure(html: str, only: str | None, parse, runs: int) -> tuple[float, float]:
+    best = float("inf")
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        parse(lf._make_soup(html, only))
+        best = min(best, time.perf_counter() - t0)
+    tracemalloc.start()
+    parse(lf._make_soup(html, only))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best * 1000, peak / 1024
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--runs", type=int, default=5, help="timed runs per case; the best is reported")
+    ap.add_argument("--scheme-plots", type=int, default=500, help="plot cards on the scaled scheme page")
+    args = ap.parse_args()
+    lf.logger.setLevel(logging.WARNING)
+
+    pages = [(label, _read(name), only, parse) for label, name, only, parse in PAGES]
+    scheme = next(html for label, html, _, _ in pages if label == "scheme")
+    pages.append((f"scheme x{args.scheme_plots}", _scale_scheme(scheme, args.scheme_plots), lf._ONLY_PLOTS,
+                  lambda soup: lf._parse_plot_details(soup, SCHEME_URL)))
+
+    print(f"{'page':<16} {'parser':<12} {'tree':<9} {'KiB in':>8} {'ms':>9} {'peak KiB':>10}")
+    for parser in ("html.parser", "lxml"):
+        lf.HTML_PARSER = parser
+        lf._html_parser.cache_clear()
+        if lf._html_parser() != parser:
+            print(f"{parser} is not installed; skipped")
+            continue
+        for label, html, only, parse in pages:
+            for tree, restrict in (("full", None), ("strained", only)):
+                ms, peak = _measure(html, restrict, parse, args.runs)
+                print(f"{label:<16} {parser:<12} {tree:<9} {len(html.encode()) / 1024:>8.1f} {ms:>9.2f} {peak:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Per-<li> cost of `_parse_plot_details` on a large synthetic scheme page: the label -> field lookup
+against the sequential `startswith` prefix scan it replaced (kept below as the reference).
+
+  python benchmarks/bench_plot_fields.py [--plots 2000] [--runs 5]
+
+Both must produce identical plots on this page; the timing covers field dispatch + link capture only
+(the soup is built once per parser, outside the timed loop).
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+from urllib.parse import urljoin
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import lambda_function as lf  # noqa: E402
+
+SCHEME_URL = f"{lf.BASE_URL}/Portal/AuctionListNew/Scheme?unit=UITALW&scheme=101"
+
+
+def synthetic_page(plots: int) -> str:
+    cards = []
+    for k in range(plots):
+        cards.append(
+            f"<ul><li>Id : UITALW-{k:05d}</li><li>Title : Plot {k}</li><li>Scheme Name : Scheme {k % 7}</li>"
+            f"<li>Property Number : P-{k}</li><li>Property Area : {100 + k % 400}.5 Sq. Meter</li>"
+            "<li>Usage Type : Residential</li><li>EMD Deposit Start Date : 01/11/2026 10:00</li>"
+            "<li>EMD Deposit End Date : 20/11/2026 17:00</li><li>EMD Amount (Rs.) : 1,50,000</li>"
+            "<li>Bid Start Date : 21/11/2026 10:00</li><li>Bid End Date : 25/11/2026 17:00</li>"
+            f"<li>Reserve Price / Assessed Property Value (Rs.) : {30 + k % 50},00,000</li>"
+            f'<li><a href="AuctionDetail?id=UITALW-{k:05d}">View Details</a></li></ul>'
+        )
+    return "<html><body>" + "".join(cards) + "</body></html>"
+
+
+_PREFIX_PAIRS = [
+    ("Title :", "title"),
+    ("Scheme Name :", "scheme_name"),
+    ("Property Number :", "property_number"),
+    ("Property Area :", "area"),
+    ("Usage Type :", "usage_type"),
+    ("EMD Deposit Start Date :", "emd_start"),
+    ("EMD Deposit End Date :", "emd_end"),
+    ("EMD Amount", "emd_amount"),
+    ("Bid Start Date :", "bid_start"),
+    ("Bid End Date :", "bid_end"),
+]
+
+
+def prefix_scan_reference(soup, scheme_url: str) -> list[dict[str, str]]:
+    """The previous `_parse_plot_details` loop: li.find("a") on every row, then a prefix scan."""
+    result, plot = [], {}
+    for li in soup.find_all("li"):
+        text = li.get_text(" ", strip=True)
+        if not text:
+            continue
+        a = li.find("a", href=True)
+        if a and a["href"] and "detail_url" not in plot:
+            plot["detail_url"] = urljoin(scheme_url, a["href"])
+        if text.startswith("Id :"):
+            if plot:
+                result.append(plot)
+            plot = {"id": text.split(":", 1)[1].strip()}
+            continue
+        for prefix, key in _PREFIX_PAIRS:
+            if text.startswith(prefix):
+                plot[key] = text.split(":", 1)[1].strip()
+                break
+        else:
+            if "Assessed Property Value" in text:
+                parts = text.split(":", 1)
+                if len(parts) > 1:
+                    plot["assessed_value"] = parts[1].strip()
+    if plot:
+        result.append(plot)
+    return result
+
+
+def _best(fn, runs: int) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--plots", type=int, default=2000)
+    ap.add_argument("--runs", type=int, default=5)
+    args = ap.parse_args()
+    lf.logger.setLevel(logging.WARNING)
+
+    html = synthetic_page(args.plots)
+    print(f"{args.plots} plots, {len(html) / 1024:.0f} KiB")
+    for parser in ("html.parser", "lxml"):
+        lf.HTML_PARSER = parser
+        lf._html_parser.cache_clear()
+        if lf._html_parser() != parser:
+            print(f"{parser} is not installed; skipped")
+            continue
+        soup = lf._make_soup(html, lf._ONLY_PLOTS)
+        n_li = len(soup.find_all("li"))
+        new = lf._parse_plot_details(soup, SCHEME_URL)
+        assert new == prefix_scan_reference(soup, SCHEME_URL), "label lookup and prefix scan disagree"
+        old_s = _best(lambda: prefix_scan_reference(soup, SCHEME_URL), args.runs)
+        new_s = _best(lambda: lf._parse_plot_details(soup, SCHEME_URL), args.runs)
+        print(
+            f"{parser:<12} {n_li} li  prefix scan {old_s * 1e6 / n_li:6.2f} us/li"
+            f"  label lookup {new_s * 1e6 / n_li:6.2f} us/li  ({old_s / new_s:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
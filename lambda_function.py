@@ -1,44 +1,111 @@
 # -*- coding: utf-8 -*-
 """
 Monitors UIT, Alwar:
-  1) UDH Live E-Auctions (UIT, Alwar plots)
+  1) UDH Live E-Auctions (UIT, Alwar plots; optionally more units, see MONITOR_UNITS)
   2) UIT Alwar site Auction page newsletters (docs)
 
-- Compares with last-saved state in S3
-- Sends ONE Telegram message per new plot/news item (HTML formatted, includes link)
+- Compares with last-saved state in S3 (or a local directory / SQLite file, see STATE_URI)
+- Queues ONE Telegram message per new plot/news item (HTML formatted, includes link) in an S3 outbox,
+  and one per plot whose auction fields changed (price, dates, ...; old -> new for each field)
 - Saves current state back to S3 (separate keys for plots and news)
+- Drains the outbox; anything not delivered is retried by the next run
 
 ENV VARS (required):
   BUCKET_NAME                         -> S3 bucket (e.g., jda-auction-list)
-  OBJECT_KEY                          -> S3 key for plots state json (default: uit_alwar_plots.json)
+  OBJECT_KEY                          -> S3 key for UIT, Alwar plots state json (default: uit_alwar_plots.json)
   OBJECT_KEY_NEWS                     -> S3 key for news state json  (default: uit_alwar_news.json)
+  OBJECT_KEY_HTTP_CACHE               -> S3 key for ETag/Last-Modified validators (default: uit_alwar_http_cache.json;
+                                         only the pages requested by the latest run are kept)
+  OBJECT_KEY_OUTBOX                   -> S3 key for pending/sent notifications (default: uit_alwar_outbox.json)
 
-Notifications (optional; if not set, script skips notify step):
+Notifications (optional; if none is set, script skips notify step):
   TELEGRAM_BOT_TOKEN                  -> Telegram bot token from @BotFather
-  TELEGRAM_CHAT_ID                    -> Target chat/channel/group id
+  TELEGRAM_CHAT_ID                    -> Target chat/channel/group id (comma-separated for several chats)
+  WEBHOOK_URLS                        -> Comma-separated URLs that get a JSON POST {"text", "parse_mode": "HTML"}
+  Every destination receives every message; destinations are delivered concurrently and independently.
+
+State backend (optional; overrides BUCKET_NAME, the OBJECT_KEY* names are kept as keys):
+  STATE_URI                           -> "s3://bucket[/prefix]" (default: s3://BUCKET_NAME),
+                                         "sqlite:///state.db" (relative) / "sqlite:////var/lib/uit/state.db" (WAL mode;
+                                         plots are rows keyed by (unit, id), only the current pages are touched per run),
+                                         or a local directory ("file:///var/lib/uit" or just a path) -- no AWS needed
+
+State format (optional):
+  STATE_FORMAT                        -> "compact" (default: gzip; record lists stored column-wise, field names once)
+                                         or "json" (plain JSON as before). Either format is read transparently.
+  STATE_LAYOUT                        -> "log" (default): plots/news state is an append-only history under
+                                         <key without .json>/ -- each run writes one small entry with only its
+                                         changes, plus a full snapshot every STATE_COMPACT_EVERY entries (default 20);
+                                         `python lambda_function.py --state-at KEY ISO-TIME` prints past state.
+                                         "document": one object per key, rewritten each run (as before).
+                                         An existing document is picked up as the starting point of the log.
+
+Units (optional):
+  MONITOR_UNITS                       -> ';'-separated unit names from the Unit Wise Summary
+                                         (default: "UIT, Alwar"; e.g. "UIT, Alwar; UIT, Bhiwadi; JDA, Jaipur")
+  OBJECT_KEY_UNIT_TEMPLATE            -> S3 key for other units' plots state (default: {slug}_plots.json,
+                                         e.g. uit_bhiwadi_plots.json); UIT, Alwar always uses OBJECT_KEY
 
 Optional tuning / resiliency:
-  TELEGRAM_MESSAGE_DELAY_MS           -> ms delay between sends (default 400)
-  TELEGRAM_MAX_MESSAGES               -> safety cap per run (default 50)
+  TELEGRAM_MIN_INTERVAL_MS            -> per-chat ms between sends (default 1000; legacy name TELEGRAM_MESSAGE_DELAY_MS)
+  TELEGRAM_CHAT_BURST                 -> per-chat messages that may go out back-to-back before pacing (default 1)
+  TELEGRAM_GLOBAL_PER_SEC             -> bot-wide messages per second across all chats (default 30)
+  TELEGRAM_MAX_RETRIES                -> retries per message on 429 (after retry_after), 5xx or network errors (default 3)
+  WEBHOOK_MIN_INTERVAL_MS             -> per-webhook ms between sends (default 0)
+  TELEGRAM_MAX_MESSAGES               -> safety cap per run (default 50; the rest stay queued; not applied in digest mode)
+  TELEGRAM_DIGEST                     -> "1" packs new items into as few messages as fit Telegram's 4096-char limit
+  OUTBOX_MAX_ATTEMPTS                 -> runs a queued message is retried before it is dropped (default 10)
+  OUTBOX_SENT_TTL_DAYS                -> days delivered keys are remembered to suppress duplicates (default 30)
+  CRAWL_MAX_WORKERS                   -> scheme pages fetched/parsed in parallel (default 4; 1 = serial)
+  HTTP_MAX_PER_HOST                   -> max in-flight requests per host (default 4)
+  HTTP_ENGINE                         -> "sync" (requests, default) or "async" (aiohttp, one event loop; aiohttp is
+                                         not in requirements.txt: install it separately)
+  HTML_PARSER                         -> BeautifulSoup tree builder: "html.parser" (default) or "lxml" (faster; lxml
+                                         is not in requirements.txt: install it separately)
+  SCHEME_REFRESH_HOURS                -> opt-in: reuse a scheme's cached plots while its listed count is unchanged, for
+                                         up to this many hours since the page was last checked (default 0 = off: every
+                                         scheme page is revalidated each run, which is cheap on 304 / unchanged body).
+                                         While skipped, a plot swapped for another (same count) and field changes
+                                         (price, dates) go unseen.
+  PLOT_TOMBSTONE_DAYS                 -> plots that leave the listing are kept as tombstones (removed_at, last_seen)
+                                         for this many days (default 90); one that comes back meanwhile is announced
+                                         as "Relisted", not "New". Each plot also carries first_seen and a relisted count.
+
+Startup check:
+  python lambda_function.py --import-budget  -> exits 1 if a cold `import lambda_function` (python -X importtime)
+                                                takes longer than IMPORT_BUDGET_MS (default 100)
 
 AWS creds:
-  Use IAM creds with s3:ListBucket on the bucket, and s3:GetObject/s3:PutObject on OBJECT_KEY & OBJECT_KEY_NEWS.
+  Use IAM creds with s3:ListBucket on the bucket, and s3:GetObject/s3:PutObject on OBJECT_KEY, OBJECT_KEY_NEWS,
+  OBJECT_KEY_HTTP_CACHE & OBJECT_KEY_OUTBOX (and, with STATE_LAYOUT=log, on the keys under their history prefixes).
 """
 
 from __future__ import annotations
 
 import datetime
+import functools
+import gzip
 import hashlib
 import json
 import logging
 import os
+import re
+import threading
 import time
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields, replace
+from typing import TYPE_CHECKING, Dict, List
+from urllib.parse import urlencode, urljoin, urlsplit
 
-import boto3
-import botocore.exceptions
-import requests
-from bs4 import BeautifulSoup
+# boto3, requests, bs4 (and aiohttp, asyncio) are imported where first used: a run that exits early
+# or never touches S3/HTML does not pay for them on a cold start. See `--import-budget` below.
+if TYPE_CHECKING:
+    import asyncio
+
+    import aiohttp
+    import boto3
+    import requests
+    from bs4 import BeautifulSoup
 
 # -----------------------
 # Logging
@@ -54,14 +121,45 @@ if not logger.handlers:
 # Config / Env
 # -----------------------
 BUCKET_NAME = os.environ.get("BUCKET_NAME")
+STATE_URI = os.environ.get("STATE_URI", "").strip()
 OBJECT_KEY = os.environ.get("OBJECT_KEY", "uit_alwar_plots.json")
 OBJECT_KEY_NEWS = os.environ.get("OBJECT_KEY_NEWS", "uit_alwar_news.json")
+OBJECT_KEY_HTTP_CACHE = os.environ.get("OBJECT_KEY_HTTP_CACHE", "uit_alwar_http_cache.json")
+OBJECT_KEY_OUTBOX = os.environ.get("OBJECT_KEY_OUTBOX", "uit_alwar_outbox.json")
+OBJECT_KEY_UNIT_TEMPLATE = os.environ.get("OBJECT_KEY_UNIT_TEMPLATE", "{slug}_plots.json")
+
+STATE_FORMAT = os.environ.get("STATE_FORMAT", "compact").strip().lower()
+STATE_LAYOUT = os.environ.get("STATE_LAYOUT", "log").strip().lower()
+STATE_COMPACT_EVERY = int(os.environ.get("STATE_COMPACT_EVERY", "20"))
+
+DEFAULT_UNIT = "UIT, Alwar"
+MONITOR_UNITS = [u.strip() for u in os.environ.get("MONITOR_UNITS", DEFAULT_UNIT).split(";") if u.strip()]
 
 TELEGRAM_BOT_TOKEN = os.environ.get("TELEGRAM_BOT_TOKEN")
 TELEGRAM_CHAT_ID = os.environ.get("TELEGRAM_CHAT_ID")
-TELEGRAM_MESSAGE_DELAY_MS = int(os.environ.get("TELEGRAM_MESSAGE_DELAY_MS", "400"))
+WEBHOOK_URLS = os.environ.get("WEBHOOK_URLS", "")
+TELEGRAM_MIN_INTERVAL_MS = int(
+    os.environ.get("TELEGRAM_MIN_INTERVAL_MS", os.environ.get("TELEGRAM_MESSAGE_DELAY_MS", "1000"))
+)
+TELEGRAM_CHAT_BURST = int(os.environ.get("TELEGRAM_CHAT_BURST", "1"))
+TELEGRAM_GLOBAL_PER_SEC = float(os.environ.get("TELEGRAM_GLOBAL_PER_SEC", "30"))
+TELEGRAM_MAX_RETRIES = int(os.environ.get("TELEGRAM_MAX_RETRIES", "3"))
+WEBHOOK_MIN_INTERVAL_MS = int(os.environ.get("WEBHOOK_MIN_INTERVAL_MS", "0"))
+TELEGRAM_DIGEST = os.environ.get("TELEGRAM_DIGEST", "0").strip().lower() in ("1", "true", "yes")
+TELEGRAM_TEXT_LIMIT = 4096
+OUTBOX_MAX_ATTEMPTS = int(os.environ.get("OUTBOX_MAX_ATTEMPTS", "10"))
+OUTBOX_SENT_TTL_DAYS = float(os.environ.get("OUTBOX_SENT_TTL_DAYS", "30"))
 TELEGRAM_MAX_MESSAGES = int(os.environ.get("TELEGRAM_MAX_MESSAGES", "50"))
 
+CRAWL_MAX_WORKERS = int(os.environ.get("CRAWL_MAX_WORKERS", "4"))
+HTTP_MAX_PER_HOST = int(os.environ.get("HTTP_MAX_PER_HOST", "4"))
+HTTP_ENGINE = os.environ.get("HTTP_ENGINE", "sync").strip().lower()
+HTTP_TIMEOUT_S = 30
+HTML_PARSER = os.environ.get("HTML_PARSER", "html.parser").strip()
+SCHEME_REFRESH_HOURS = float(os.environ.get("SCHEME_REFRESH_HOURS", "0"))
+PLOT_TOMBSTONE_DAYS = float(os.environ.get("PLOT_TOMBSTONE_DAYS", "90"))
+IMPORT_BUDGET_MS = float(os.environ.get("IMPORT_BUDGET_MS", "100"))
+
 BASE_URL = "https://udhonline.rajasthan.gov.in"
 SUMMARY_URL = f"{BASE_URL}/Portal/AuctionListNew"
 
@@ -71,86 +169,361 @@ NEWS_URL = f"{NEWS_BASE}/Auction.aspx"
 # -----------------------
 # HTTP helpers
 # -----------------------
-def _get(session: requests.Session, url: str, params: dict | None = None) -> BeautifulSoup:
+_host_slots: dict[str, threading.BoundedSemaphore] = {}
+_host_slots_lock = threading.Lock()
+
+def _host_slot(url: str) -> threading.BoundedSemaphore:
+    """Per-host semaphore that bounds in-flight requests to HTTP_MAX_PER_HOST."""
+    host = urlsplit(url).netloc
+    with _host_slots_lock:
+        slot = _host_slots.get(host)
+        if slot is None:
+            slot = _host_slots[host] = threading.BoundedSemaphore(max(1, HTTP_MAX_PER_HOST))
+    return slot
+
+def new_session(pool_maxsize: int | None = None) -> requests.Session:
+    """Session whose per-host connection pool is large enough for the concurrent crawl."""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=pool_maxsize or max(HTTP_MAX_PER_HOST, CRAWL_MAX_WORKERS, 1))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+# -----------------------
+# Pooled clients, created on first use and reused across warm Lambda invocations
+# -----------------------
+_clients: dict[str, object] = {}
+_clients_lock = threading.RLock()  # factories may create the clients they depend on
+
+def _client(name: str, factory):
+    with _clients_lock:
+        client = _clients.get(name)
+        if client is None:
+            client = _clients[name] = factory()
+    return client
+
+def http_session() -> requests.Session:
+    """Scraper session; kept-alive connections to the auction hosts survive between invocations."""
+    return _client("http", new_session)
+
+def notify_session() -> requests.Session:
+    """Session for every notification sink, so sends reuse TCP+TLS connections instead of handshaking per message."""
+    return _client("notify", lambda: new_session(pool_maxsize=8))
+
+def s3_client() -> boto3.client:
+    """S3 client sized for the concurrent pipelines (one per unit + news) writing state at once."""
+    import boto3
+    import botocore.config
+
+    return _client("s3", lambda: boto3.client("s3", config=botocore.config.Config(
+        max_pool_connections=max(10, len(MONITOR_UNITS) + 2),
+        tcp_keepalive=True,
+    )))
+
+_BROWSER_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/124.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Connection": "keep-alive",
+}
+
+@functools.lru_cache(maxsize=None)
+def _html_parser() -> str:
+    """HTML_PARSER if its tree builder is installed, else the stdlib "html.parser"."""
+    from bs4 import BeautifulSoup, FeatureNotFound
+
+    try:
+        BeautifulSoup("", HTML_PARSER)
+        return HTML_PARSER
+    except FeatureNotFound:
+        logger.warning("HTML_PARSER=%s is not installed; falling back to html.parser", HTML_PARSER)
+        return "html.parser"
+
+# Per page type, the only elements its parser looks at; everything else is never materialized.
+_ONLY_SUMMARY = "summary"
+_ONLY_SCHEMES = "schemes"
+_ONLY_PLOTS = "plots"
+_ONLY_NEWS = "news"
+_PARSE_ONLY = {
+    _ONLY_SUMMARY: (["h2", "h3", "h4", "table"], {}),
+    _ONLY_SCHEMES: ("table", {}),
+    _ONLY_PLOTS: ("li", {}),
+    _ONLY_NEWS: ("table", {"id": "ContentPlaceHolder1_gridview1"}),
+}
+
+@functools.lru_cache(maxsize=None)
+def _strainer(only: str):
+    from bs4 import SoupStrainer
+
+    name, attrs = _PARSE_ONLY[only]
+    return SoupStrainer(name, attrs)
+
+def _make_soup(html: str, only: str | None = None) -> BeautifulSoup:
+    """`only` names a page type in _PARSE_ONLY; the parse is restricted to its elements."""
+    from bs4 import BeautifulSoup
+
+    return BeautifulSoup(html, _html_parser(), parse_only=_strainer(only) if only else None)
+
+# -----------------------
+# Conditional GET: per-URL validators, body fingerprint + last parsed result, persisted in S3
+# -----------------------
+class NotModified(Exception):
+    """Raised by `_get(..., cache=True)` when the cached parse result for the URL is still valid."""
+
+# ASP.NET re-renders these hidden fields on every request even when the page content is identical.
+_VOLATILE_RE = re.compile(
+    rb"""<input[^>]*\bname=["']?__(?:VIEWSTATE\w*|EVENTVALIDATION|EVENTTARGET|EVENTARGUMENT|PREVIOUSPAGE)\b[^>]*>""",
+    re.IGNORECASE,
+)
+
+def _body_fingerprint(body: bytes) -> str:
+    return hashlib.blake2b(_VOLATILE_RE.sub(b"", body), digest_size=16).hexdigest()
+
+# Bump whenever a parser's result shape changes so stale cached results are never reused.
+HTTP_CACHE_VERSION = 2
+
+_http_cache: dict[str, dict] = {}
+_http_fresh: dict[str, bool] = {}  # this run only: cache key -> page changed since last run?
+
+def _cache_key(url: str, params: dict | None = None) -> str:
+    return f"{url}?{urlencode(params)}" if params else url
+
+def load_http_cache(store: StateBackend) -> None:
+    _http_cache.clear()
+    _http_fresh.clear()
+    try:
+        stored = load_json(store, OBJECT_KEY_HTTP_CACHE) or {}
+        if stored.get("version") == HTTP_CACHE_VERSION:
+            _http_cache.update(stored.get("entries") or {})
+    except Exception as e:
+        logger.warning("Could not load HTTP cache, fetching everything: %s", e)
+    logger.info("HTTP cache entries loaded: %d", len(_http_cache))
+
+def save_http_cache(store: StateBackend) -> None:
+    # Pages not requested this run (schemes that left the listing, failed fetches) are dropped, so the
+    # document does not grow forever; entries are not touched on a hit, so an all-304 run rewrites nothing.
+    entries = {key: entry for key, entry in _http_cache.items() if key in _http_fresh}
+    try:
+        save_json(store, OBJECT_KEY_HTTP_CACHE, {"version": HTTP_CACHE_VERSION, "entries": entries})
+    except Exception as e:
+        logger.warning("Could not save HTTP cache: %s", e)
+
+def _conditional_headers(key: str) -> dict[str, str]:
+    # Only revalidate when there is a parsed result to fall back to on 304.
+    entry = _http_cache.get(key)
+    if not entry or "result" not in entry:
+        return {}
+    headers = {}
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+def _body_unchanged(key: str, headers, body: bytes) -> bool:
     """
-    GET with a browser-ish User-Agent and optional params (3.11 syntax).
+    Record validators + fingerprint for a 200 response. Returns True when the body matches
+    the last run's fingerprint (servers that ignore conditional headers), so parsing can be skipped.
     """
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/124.0 Safari/537.36"
-        ),
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.9",
-        "Connection": "keep-alive",
+    digest = _body_fingerprint(body)
+    entry = _http_cache.get(key)
+    if entry and "result" in entry and entry.get("hash") == digest:
+        # Validators are left as is: this server's did not get a 304 for an unchanged page, so fresh ones
+        # would not either, and an untouched cache document is not rewritten.
+        return True
+    # A changed 200 invalidates the old result; the caller stores the new one once parsing succeeds.
+    _http_cache[key] = {
+        "etag": headers.get("ETag"),
+        "last_modified": headers.get("Last-Modified"),
+        "hash": digest,
+        "checked_at": time.time(),
     }
+    _http_fresh[key] = True
+    return False
+
+def _mark_checked(entry: dict) -> None:
+    """
+    Record a successful revalidation for SCHEME_REFRESH_HOURS. Only once the stamp is a quarter of the window
+    old, so most hits leave the entry (and the cache document) untouched; with the setting off, never.
+    """
+    now = time.time()
+    if SCHEME_REFRESH_HOURS > 0 and now - entry.get("checked_at", 0) > SCHEME_REFRESH_HOURS * 3600 / 4:
+        entry["checked_at"] = now
+
+def _not_modified(key: str, reason: str = "HTTP 304 Not Modified") -> NotModified:
+    logger.info(f"{reason}: {key}")
+    _mark_checked(_http_cache[key])
+    _http_fresh[key] = False
+    return NotModified(key)
+
+def _cached_result(key: str):
+    return _http_cache[key]["result"]
+
+def _store_result(key: str, result):
+    if key in _http_cache:
+        _http_cache[key]["result"] = result
+    return result
+
+def _pages_unchanged(url: str) -> bool:
+    """True when every page fetched from `url`'s host this run was answered from the cache."""
+    host = urlsplit(url).netloc
+    seen = [fresh for key, fresh in _http_fresh.items() if urlsplit(key).netloc == host]
+    return bool(seen) and not any(seen)
+
+def _forget_host(url: str) -> None:
+    """Drop cached results for `url`'s host so a failed run is fully re-fetched (and re-diffed) next time."""
+    host = urlsplit(url).netloc
+    for key in [k for k in _http_cache if urlsplit(k).netloc == host]:
+        _http_cache.pop(key, None)
+
+def _get(
+    session: requests.Session,
+    url: str,
+    params: dict | None = None,
+    cache: bool = False,
+    only: str | None = None,
+) -> BeautifulSoup:
+    """
+    GET with a browser-ish User-Agent and optional params (3.11 syntax).
+    With cache=True, sends If-None-Match/If-Modified-Since and raises NotModified on 304
+    or when the body is byte-identical (minus ASP.NET hidden state) to the last run.
+    `only` restricts the parse to the matching elements.
+    """
+    key = _cache_key(url, params)
+    headers = {**_BROWSER_HEADERS, **_conditional_headers(key)} if cache else _BROWSER_HEADERS
     logger.info(f"HTTP GET {url} params={params or {}}")
-    resp = session.get(url, params=params, headers=headers, timeout=30)
+    with _host_slot(url):
+        resp = session.get(url, params=params, headers=headers, timeout=HTTP_TIMEOUT_S)
+    if cache and resp.status_code == 304:
+        raise _not_modified(key)
     resp.raise_for_status()
-    return BeautifulSoup(resp.text, "html.parser")
+    if cache and _body_unchanged(key, resp.headers, resp.content):
+        raise _not_modified(key, "Body unchanged")
+    return _make_soup(resp.text, only)
+
+def _fetch_parsed(
+    session: requests.Session,
+    url: str,
+    parse,
+    params: dict | None = None,
+    only: str | None = None,
+):
+    """`parse(_get(...))`, or the result cached from the last run if the server answers 304."""
+    key = _cache_key(url, params)
+    try:
+        soup = _get(session, url, params, cache=True, only=only)
+    except NotModified:
+        return _cached_result(key)
+    return _store_result(key, parse(soup))
 
 def fetch_unit_wise_summary(session: requests.Session) -> BeautifulSoup:
     """Fetch the 'Live E-Auctions' summary page with a cache buster."""
-    return _get(session, SUMMARY_URL, params={"_": "nocache"})
+    return _get(session, SUMMARY_URL, params={"_": "nocache"}, only=_ONLY_SUMMARY)
+
+def fetch_unit_index(session: requests.Session) -> dict[str, dict]:
+    """Summary page -> `build_unit_index` (revalidated with a conditional GET)."""
+    return _fetch_parsed(session, SUMMARY_URL, build_unit_index, params={"_": "nocache"}, only=_ONLY_SUMMARY)
 
 # -----------------------
 # Summary -> UIT, Alwar link
 # -----------------------
-def extract_uit_alwar_link(soup: BeautifulSoup) -> str:
+class UnitNotFound(ValueError):
+    """The requested unit has no linked row in the Unit Wise Summary table."""
+
+def _norm_unit(name: str) -> str:
+    """'UIT,  Alwar' -> 'uit alwar' (index key for unit lookups)."""
+    return " ".join(name.replace(",", " ").split()).lower()
+
+def build_unit_index(soup: BeautifulSoup) -> dict[str, dict]:
     """
-    Find the UIT, Alwar row in the Unit Wise Summary table and return the first link href.
-    NOTE: Unit Name is in the 2nd column (index 1). First column is S.No.
-    Raises ValueError if UIT, Alwar is not found.
+    Walk the Unit Wise Summary table once and index every unit row by normalized name:
+      {"uit alwar": {"unit": "UIT, Alwar", "href": <first link, absolute> | None, "cells": [...], "row_text": "..."}}
+    NOTE: Unit Name is in the 2nd column (index 1). First column is S.No.; later columns hold the counts.
+    Raises ValueError if there is no table at all.
     """
     hdr = soup.find(lambda tag: tag.name in ("h2", "h3", "h4") and "Unit Wise Summary" in tag.get_text(strip=True))
     table = hdr.find_next("table") if hdr else soup.find("table")
     if not table:
-        tables = soup.find_all("table")
-        if not tables:
-            raise ValueError("Could not find unit summary table")
-        table = tables[0]
+        raise ValueError("Could not find unit summary table")
 
-    # Log all available UIT entries for debugging
-    available_units = []
+    index: dict[str, dict] = {}
     for tr in table.find_all("tr"):
         tds = tr.find_all("td")
-        if len(tds) >= 2:
-            unit_name = " ".join(tds[1].get_text(strip=True).split())
-            if unit_name.lower().startswith("uit"):
-                available_units.append(unit_name)
-    
+        if len(tds) < 2:
+            continue
+        cells = [" ".join(td.get_text(" ", strip=True).split()) for td in tds]
+        a = tr.find("a", href=True)
+        key = _norm_unit(cells[1])
+        # First row per unit wins, unless it has no link and a later duplicate does (as the old scan found).
+        if key in index and (index[key]["href"] or not a):
+            continue
+        index[key] = {
+            "unit": cells[1],
+            "href": urljoin(SUMMARY_URL, a["href"]) if a else None,
+            "cells": cells,
+            "row_text": " ".join(cells).lower(),
+        }
+
+    # Log all available UIT entries for debugging
+    available_units = [row["unit"] for key, row in index.items() if key.startswith("uit")]
     if available_units:
         logger.info(f"Available UIT units found: {available_units}")
     else:
         logger.warning("No UIT units found in the summary table")
+    return index
 
-    # Primary search: look for UIT, Alwar specifically
-    for tr in table.find_all("tr"):
-        tds = tr.find_all("td")
-        if len(tds) >= 2:
-            unit_name = " ".join(tds[1].get_text(strip=True).split())
-            if unit_name.lower().startswith("uit, alwar"):
-                a = tr.find("a", href=True)
-                if a:
-                    href = requests.compat.urljoin(SUMMARY_URL, a["href"])
-                    logger.info(f"Found UIT, Alwar link: {href}")
-                    return href
-
-    # Fallback: scan row text for both "uit" and "alwar"
-    for tr in table.find_all("tr"):
-        row_text = " ".join(tr.get_text(" ", strip=True).split()).lower()
-        if "uit" in row_text and "alwar" in row_text:
-            a = tr.find("a", href=True)
-            if a:
-                href = requests.compat.urljoin(SUMMARY_URL, a["href"])
-                logger.info(f"Found UIT, Alwar link via fallback scan: {href}")
-                return href
+def find_unit(index: dict[str, dict], unit: str) -> dict | None:
+    """
+    Exact normalized-name lookup; falls back to a name prefix match (e.g. 'UIT, Alwar (Raj.)')
+    and then to a row containing every word of `unit`.
+    """
+    key = _norm_unit(unit)
+    row = index.get(key)
+    if row and row["href"]:
+        return row
+    words = key.split()
+    for candidates in (
+        (r for k, r in index.items() if k.startswith(key)),
+        (r for r in index.values() if all(w in r["row_text"] for w in words)),
+    ):
+        for r in candidates:
+            if r["href"]:
+                return r
+    return None
+
+def unit_link(index: dict[str, dict], unit: str) -> str:
+    """Detail page link for `unit`. Raises UnitNotFound if the unit is not listed."""
+    row = find_unit(index, unit)
+    if row:
+        logger.info(f"Found {unit} link: {row['href']}")
+        return row["href"]
 
     # Provide a more informative error message
-    error_msg = f"UIT, Alwar row not found in summary table. Available UIT units: {available_units}"
+    available_units = [r["unit"] for k, r in index.items() if k.startswith("uit")]
+    error_msg = f"{unit} row not found in summary table. Available UIT units: {available_units}"
     logger.error(error_msg)
-    raise ValueError(error_msg)
+    raise UnitNotFound(error_msg)
+
+def extract_uit_alwar_link(soup: BeautifulSoup) -> str:
+    """
+    Find the UIT, Alwar row in the Unit Wise Summary table and return the first link href.
+    Raises UnitNotFound if UIT, Alwar is not found.
+    """
+    return unit_link(build_unit_index(soup), DEFAULT_UNIT)
+
+def unit_state_key(unit: str) -> str:
+    """S3 key for a unit's plots state; UIT, Alwar keeps the historical OBJECT_KEY."""
+    if _norm_unit(unit) == _norm_unit(DEFAULT_UNIT):
+        return OBJECT_KEY
+    slug = re.sub(r"[^a-z0-9]+", "_", unit.lower()).strip("_")
+    return OBJECT_KEY_UNIT_TEMPLATE.format(slug=slug)
 
 # -----------------------
 # UIT, Alwar detail -> schemes list
@@ -159,7 +532,9 @@ def fetch_scheme_list(session: requests.Session, detail_url: str) -> list[dict[s
     """
     Parse the detail page showing schemes (name + count link) -> return list[{scheme_name, href, count}]
     """
-    soup = _get(session, detail_url)
+    return _fetch_parsed(session, detail_url, lambda soup: _parse_scheme_list(soup, detail_url), only=_ONLY_SCHEMES)
+
+def _parse_scheme_list(soup: BeautifulSoup, detail_url: str) -> list[dict[str, str]]:
     table = soup.find("table")
     if not table:
         logger.warning("No schemes table found on UIT, Alwar detail page")
@@ -175,21 +550,172 @@ def fetch_scheme_list(session: requests.Session, detail_url: str) -> list[dict[s
         scheme_name = cols[1].get_text(strip=True)
         link = cols[2].find("a", href=True)
         count_text = cols[2].get_text(strip=True)
-        href = requests.compat.urljoin(detail_url, link["href"]) if link else None
+        href = urljoin(detail_url, link["href"]) if link else None
         out.append({"scheme_name": scheme_name, "href": href, "count": count_text})
     logger.info(f"Schemes found: {len(out)}")
     return out
 
+# -----------------------
+# Records: typed plot / newsletter items (state codecs + parsed numeric & date fields)
+# -----------------------
+_WS_RE = re.compile(r"\s+")
+_NUMBER_RE = re.compile(r"\d[\d,]*(?:\.\d+)?")
+# Area units seen on scheme pages -> square metres per unit (plain "Sq. Meter" is the default).
+# Whole words only: "(Left side)" must not read as "ft". A digit may precede the unit ("1200sq.ft").
+_AREA_UNIT_RE = re.compile(r"(?<![a-z])(?:sq\.?\s*)?(yards?|yd|feet|ft)\b")
+_AREA_UNITS = {"yard": 0.83612736, "yards": 0.83612736, "yd": 0.83612736, "feet": 0.09290304, "ft": 0.09290304}
+_DATE_FORMATS = ("%d/%m/%Y %H:%M", "%d/%m/%Y %I:%M %p", "%d/%m/%Y %H:%M:%S", "%d-%m-%Y %H:%M", "%d/%m/%Y", "%d-%m-%Y")
+
+def _parse_number(text: str | None) -> float | None:
+    m = _NUMBER_RE.search(text or "")
+    return float(m.group().replace(",", "")) if m else None
+
+def _parse_amount(text: str | None) -> int | None:
+    """ "5,000" / "1,00,000" / "Rs. 12,345.50" -> whole rupees."""
+    value = _parse_number(text)
+    return int(value) if value is not None else None
+
+def _parse_area(text: str | None) -> float | None:
+    value = _parse_number(text)
+    if value is None:
+        return None
+    m = _AREA_UNIT_RE.search(text.lower())
+    return round(value * _AREA_UNITS[m.group(1)], 2) if m else value
+
+@functools.lru_cache(maxsize=1024)
+def _parse_datetime(text: str | None) -> datetime.datetime | None:
+    # Cached: every plot of a scheme usually shares the same EMD/bid dates.
+    text = _WS_RE.sub(" ", text or "").strip()
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    return None
+
+@dataclass(slots=True)
+class Plot:
+    """
+    One plot as scraped (strings, exactly as on the page) plus its state lifecycle fields.
+    The parsed fields (area_sqm, *_inr, *_at) are derived on construction and never stored.
+    """
+    id: str | None = None
+    title: str | None = None
+    scheme_name: str | None = None
+    property_number: str | None = None
+    area: str | None = None
+    usage_type: str | None = None
+    emd_start: str | None = None
+    emd_end: str | None = None
+    emd_amount: str | None = None
+    bid_start: str | None = None
+    bid_end: str | None = None
+    assessed_value: str | None = None
+    detail_url: str | None = None
+    # State: fingerprint and lifecycle (see next_plot_state)
+    fp: str | None = None
+    first_seen: float | None = None
+    last_seen: float | None = None
+    removed_at: float | None = None
+    relisted: int | None = None
+    # Parsed
+    area_sqm: float | None = field(default=None, init=False, repr=False, compare=False)
+    emd_amount_inr: int | None = field(default=None, init=False, repr=False, compare=False)
+    assessed_value_inr: int | None = field(default=None, init=False, repr=False, compare=False)
+    emd_start_at: datetime.datetime | None = field(default=None, init=False, repr=False, compare=False)
+    emd_end_at: datetime.datetime | None = field(default=None, init=False, repr=False, compare=False)
+    bid_start_at: datetime.datetime | None = field(default=None, init=False, repr=False, compare=False)
+    bid_end_at: datetime.datetime | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.area_sqm = _parse_area(self.area)
+        self.emd_amount_inr = _parse_amount(self.emd_amount)
+        self.assessed_value_inr = _parse_amount(self.assessed_value)
+        self.emd_start_at = _parse_datetime(self.emd_start)
+        self.emd_end_at = _parse_datetime(self.emd_end)
+        self.bid_start_at = _parse_datetime(self.bid_start)
+        self.bid_end_at = _parse_datetime(self.bid_end)
+
+    @classmethod
+    def from_state(cls, d: dict) -> Plot:
+        """From a scraped/stored dict; unknown keys are ignored."""
+        return cls(**{k: v for k, v in d.items() if k in _PLOT_STATE_KEYS})
+
+    def to_state(self) -> dict:
+        """The stored dict: set fields only, so unchanged plots encode exactly as before."""
+        return {f: v for f in _PLOT_STATE_FIELDS if (v := getattr(self, f)) is not None}
+
+@dataclass(slots=True)
+class Newsletter:
+    """One row of the newsletter table; `auction_date` is parsed from `date`."""
+    id: str | None = None
+    date: str | None = None
+    detail: str | None = None
+    venue_time: str | None = None
+    url: str | None = None
+    title: str | None = None
+    auction_date: datetime.date | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        parsed = _parse_datetime(self.date)
+        self.auction_date = parsed.date() if parsed else None
+
+    @classmethod
+    def from_state(cls, d: dict) -> Newsletter:
+        return cls(**{k: v for k, v in d.items() if k in _NEWSLETTER_STATE_KEYS})
+
+    def to_state(self) -> dict:
+        return {f: v for f in _NEWSLETTER_STATE_FIELDS if (v := getattr(self, f)) is not None}
+
+_PLOT_STATE_FIELDS = tuple(f.name for f in fields(Plot) if f.init)
+_PLOT_STATE_KEYS = frozenset(_PLOT_STATE_FIELDS)
+_NEWSLETTER_STATE_FIELDS = tuple(f.name for f in fields(Newsletter) if f.init)
+_NEWSLETTER_STATE_KEYS = frozenset(_NEWSLETTER_STATE_FIELDS)
+
 # -----------------------
 # Scheme page -> plot details (with optional detail_url)
 # -----------------------
-def fetch_plot_details(session: requests.Session, scheme_url: str) -> list[dict[str, str]]:
+def fetch_plot_details(session: requests.Session, scheme_url: str) -> list[Plot]:
     """
     Parse scheme page with "Auction Details" list. Return plots[]
-    Each plot dict includes:
+    Each plot has (when listed):
       id, title, scheme_name, property_number, area, usage_type, emd_start, emd_end, emd_amount, bid_start, bid_end, assessed_value, detail_url?
     """
-    soup = _get(session, scheme_url)
+    raw = _fetch_parsed(session, scheme_url, lambda soup: _parse_plot_details(soup, scheme_url), only=_ONLY_PLOTS)
+    return [Plot.from_state(d) for d in raw]
+
+# Label before the first ":" of a scheme-page <li> -> plot field. "Id" starts a new plot.
+_PLOT_FIELD_BY_LABEL = {
+    "Id": "id",
+    "Title": "title",
+    "Scheme Name": "scheme_name",
+    "Property Number": "property_number",
+    "Property Area": "area",
+    "Usage Type": "usage_type",
+    "EMD Deposit Start Date": "emd_start",
+    "EMD Deposit End Date": "emd_end",
+    "EMD Amount": "emd_amount",
+    "Bid Start Date": "bid_start",
+    "Bid End Date": "bid_end",
+    "Assessed Property Value": "assessed_value",
+}
+
+def _plot_field_for_label(label: str) -> str | None:
+    """Labels the exact lookup misses: "EMD Amount (Rs.)", "... Assessed Property Value (Rs.)" and the like."""
+    if label.startswith("EMD Amount"):
+        return "emd_amount"
+    if "Assessed Property Value" in label:
+        return "assessed_value"
+    return None
+
+def _first_href(li) -> str | None:
+    """href of the first <a href> under `li`, like li.find("a", href=True) without its per-call matcher setup."""
+    for node in li.descendants:
+        if node.name == "a" and "href" in node.attrs:
+            return node["href"]
+    return None
+
+def _parse_plot_details(soup: BeautifulSoup, scheme_url: str) -> list[dict[str, str]]:
     result: list[dict[str, str]] = []
 
     # The page tends to have an UL/LI list with lines like "Id :", "Title :", etc.
@@ -203,63 +729,100 @@ def fetch_plot_details(session: requests.Session, scheme_url: str) -> list[dict[
             result.append(plot)
             plot = {}
 
-    def capture_link_from_li(li) -> str | None:
-        a = li.find("a", href=True)
-        if a and a["href"]:
-            return requests.compat.urljoin(scheme_url, a["href"])
-        return None
-
+    labels = _PLOT_FIELD_BY_LABEL
     for li in lis:
         text = li.get_text(" ", strip=True)
         if not text:
             continue
 
         # If this LI contains a link, keep the first one as a potential detail link
-        href = capture_link_from_li(li)
-        if href and "detail_url" not in plot:
-            plot["detail_url"] = href
+        if "detail_url" not in plot:
+            href = _first_href(li)
+            if href:
+                plot["detail_url"] = urljoin(scheme_url, href)
 
-        if text.startswith("Id :"):
+        label, colon, value = text.partition(":")
+        if not colon:
+            continue
+        label = label.rstrip()
+        key = labels.get(label) or _plot_field_for_label(label)
+        if key == "id":
             # new plot starts
             flush()
-            plot["id"] = text.split(":", 1)[1].strip()
-            continue
-
-        # field mappings
-        pairs = [
-            ("Title :", "title"),
-            ("Scheme Name :", "scheme_name"),
-            ("Property Number :", "property_number"),
-            ("Property Area :", "area"),
-            ("Usage Type :", "usage_type"),
-            ("EMD Deposit Start Date :", "emd_start"),
-            ("EMD Deposit End Date :", "emd_end"),
-            ("EMD Amount", "emd_amount"),
-            ("Bid Start Date :", "bid_start"),
-            ("Bid End Date :", "bid_end"),
-        ]
-        matched = False
-        for prefix, key in pairs:
-            if text.startswith(prefix):
-                plot[key] = text.split(":", 1)[1].strip()
-                matched = True
-                break
-        if matched:
-            continue
-
-        if "Assessed Property Value" in text:
-            parts = text.split(":", 1)
-            if len(parts) > 1:
-                plot["assessed_value"] = parts[1].strip()
+        if key:
+            plot[key] = value.strip()
 
     flush()
     logger.info(f"Plots found on scheme page: {len(result)}")
     return result
 
+def fetch_all_plot_details(session: requests.Session, schemes: list[dict[str, str]]) -> list[Plot]:
+    """
+    Crawl every scheme page (CRAWL_MAX_WORKERS at a time) and return the combined plots.
+    Order follows `schemes`, not completion order, so output is deterministic.
+    """
+    targets = [s for s in schemes if s.get("href")]
+
+    def crawl(s: dict[str, str]) -> list[Plot]:
+        plots = _unchanged_scheme_plots(s)
+        if plots is None:
+            plots = fetch_plot_details(session, s["href"])
+            _remember_scheme_count(s)
+        return _tag_scheme_plots(plots, s)
+
+    workers = min(CRAWL_MAX_WORKERS, len(targets))
+    if workers <= 1:
+        results = [crawl(s) for s in targets]
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scheme") as pool:
+            results = list(pool.map(crawl, targets))
+
+    return [p for plots in results for p in plots]
+
+def _unchanged_scheme_plots(scheme: dict[str, str]) -> list[Plot] | None:
+    """
+    Plots from the last crawl of `scheme` when its href and listed count are unchanged and the page was
+    checked within SCHEME_REFRESH_HOURS; None means the scheme page has to be fetched (always, when the
+    setting is 0).
+    """
+    if SCHEME_REFRESH_HOURS <= 0:
+        return None
+    key = scheme["href"]
+    entry = _http_cache.get(key)
+    if (
+        not entry
+        or "result" not in entry
+        or entry.get("count") != scheme.get("count")
+        or time.time() - entry.get("checked_at", 0) > SCHEME_REFRESH_HOURS * 3600
+    ):
+        return None
+    logger.info(f"Scheme count unchanged ({scheme.get('count')}); reusing plots for {key}")
+    _http_fresh[key] = False
+    return [Plot.from_state(d) for d in entry["result"]]
+
+def _remember_scheme_count(scheme: dict[str, str]) -> None:
+    entry = _http_cache.get(scheme["href"])
+    if entry is not None:
+        entry["count"] = scheme.get("count")
+
+def _tag_scheme_plots(plots: list[Plot], scheme: dict[str, str]) -> list[Plot]:
+    for p in plots:
+        if p.scheme_name is None:
+            p.scheme_name = scheme.get("scheme_name")
+        # If no detail_url captured from LI, fallback to scheme page (at least something clickable)
+        if p.detail_url is None:
+            p.detail_url = scheme.get("href")
+    return plots
+
+def crawl_unit_plots(session: requests.Session, index: dict[str, dict], unit: str) -> list[Plot]:
+    """Unit index -> unit detail -> schemes -> plots. Raises UnitNotFound if the unit is not listed."""
+    schemes = fetch_scheme_list(session, unit_link(index, unit))
+    return fetch_all_plot_details(session, schemes)
+
 # -----------------------
 # UIT Alwar Newsletter scrape (by exact table id)
 # -----------------------
-def fetch_newsletters(session: requests.Session) -> list[dict[str, str]]:
+def fetch_newsletters(session: requests.Session) -> list[Newsletter]:
     """
     Scrape http://uitalwar.rajasthan.gov.in/Auction.aspx
     Table: id='ContentPlaceHolder1_gridview1'
@@ -269,9 +832,12 @@ def fetch_newsletters(session: requests.Session) -> list[dict[str, str]]:
       2: Auction Detail
       3: Venue and Time for Auction
       4: Uploaded File (anchor)
-    Returns items with keys: id, date, detail, venue_time, url, title
+    Returns items with: id, date, detail, venue_time, url, title
     """
-    soup = _get(session, NEWS_URL, params={"_": "nocache"})
+    raw = _fetch_parsed(session, NEWS_URL, _parse_newsletters, params={"_": "nocache"}, only=_ONLY_NEWS)
+    return [Newsletter.from_state(d) for d in raw]
+
+def _parse_newsletters(soup: BeautifulSoup) -> list[dict[str, str]]:
     table = soup.find("table", id="ContentPlaceHolder1_gridview1")
     if not table:
         logger.warning("News table not found: ContentPlaceHolder1_gridview1")
@@ -294,7 +860,7 @@ def fetch_newsletters(session: requests.Session) -> list[dict[str, str]]:
 
         # Uploaded file link
         a = tds[4].find("a", href=True)
-        url = requests.compat.urljoin(NEWS_URL, a["href"]) if a else ""
+        url = urljoin(NEWS_URL, a["href"]) if a else ""
         title = a.get_text(" ", strip=True) if a else "View Document"
 
         # Make a stable ID (prefer the file URL if available)
@@ -314,198 +880,1436 @@ def fetch_newsletters(session: requests.Session) -> list[dict[str, str]]:
     return items
 
 # -----------------------
-# State: S3 read/write
+# Async engine (HTTP_ENGINE=async): same parsers, aiohttp transport
 # -----------------------
-def load_json(s3_client: boto3.client, key: str) -> list[dict[str, str]]:
+def new_async_client() -> aiohttp.ClientSession:
+    """
+    One pooled aiohttp session shared by every async fetch in the run.
+    aiohttp is imported lazily so the sync engine does not require it.
+    """
+    import aiohttp
+
+    connector = aiohttp.TCPConnector(limit_per_host=max(1, HTTP_MAX_PER_HOST))
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers=_BROWSER_HEADERS,
+        timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT_S),
+    )
+
+async def _aget(
+    client: aiohttp.ClientSession,
+    url: str,
+    params: dict | None = None,
+    cache: bool = False,
+    only: str | None = None,
+) -> BeautifulSoup:
+    """Async counterpart of `_get`."""
+    key = _cache_key(url, params)
+    headers = _conditional_headers(key) if cache else None
+    logger.info(f"HTTP GET (async) {url} params={params or {}}")
+    async with client.get(url, params=params, headers=headers) as resp:
+        if cache and resp.status == 304:
+            raise _not_modified(key)
+        resp.raise_for_status()
+        if cache and _body_unchanged(key, resp.headers, await resp.read()):
+            raise _not_modified(key, "Body unchanged")
+        html = await resp.text()
+    return _make_soup(html, only)
+
+async def _afetch_parsed(
+    client: aiohttp.ClientSession,
+    url: str,
+    parse,
+    params: dict | None = None,
+    only: str | None = None,
+):
+    """Async counterpart of `_fetch_parsed`."""
+    key = _cache_key(url, params)
     try:
-        resp = s3_client.get_object(Bucket=BUCKET_NAME, Key=key)
-        body = resp["Body"].read().decode("utf-8")
-        return json.loads(body) if body else []
-    except botocore.exceptions.ClientError as e:
-        if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+        soup = await _aget(client, url, params, cache=True, only=only)
+    except NotModified:
+        return _cached_result(key)
+    return _store_result(key, parse(soup))
+
+async def afetch_unit_index(client: aiohttp.ClientSession) -> dict[str, dict]:
+    return await _afetch_parsed(client, SUMMARY_URL, build_unit_index, params={"_": "nocache"}, only=_ONLY_SUMMARY)
+
+async def afetch_scheme_list(client: aiohttp.ClientSession, detail_url: str) -> list[dict[str, str]]:
+    return await _afetch_parsed(client, detail_url, lambda soup: _parse_scheme_list(soup, detail_url), only=_ONLY_SCHEMES)
+
+async def afetch_plot_details(client: aiohttp.ClientSession, scheme_url: str) -> list[Plot]:
+    raw = await _afetch_parsed(client, scheme_url, lambda soup: _parse_plot_details(soup, scheme_url), only=_ONLY_PLOTS)
+    return [Plot.from_state(d) for d in raw]
+
+async def afetch_all_plot_details(client: aiohttp.ClientSession, schemes: list[dict[str, str]]) -> list[Plot]:
+    """Async counterpart of `fetch_all_plot_details` (same ordering guarantee)."""
+    import asyncio
+
+    gate = asyncio.Semaphore(max(1, CRAWL_MAX_WORKERS))
+
+    async def crawl(s: dict[str, str]) -> list[Plot]:
+        plots = _unchanged_scheme_plots(s)
+        if plots is None:
+            async with gate:
+                plots = await afetch_plot_details(client, s["href"])
+            _remember_scheme_count(s)
+        return _tag_scheme_plots(plots, s)
+
+    results = await asyncio.gather(*(crawl(s) for s in schemes if s.get("href")))
+    return [p for plots in results for p in plots]
+
+async def acrawl_unit_plots(client: aiohttp.ClientSession, index_task: asyncio.Task, unit: str) -> list[Plot]:
+    """Async counterpart of `crawl_unit_plots`; `index_task` is the one summary fetch shared by all units."""
+    schemes = await afetch_scheme_list(client, unit_link(await index_task, unit))
+    return await afetch_all_plot_details(client, schemes)
+
+async def afetch_newsletters(client: aiohttp.ClientSession) -> list[Newsletter]:
+    raw = await _afetch_parsed(client, NEWS_URL, _parse_newsletters, params={"_": "nocache"}, only=_ONLY_NEWS)
+    return [Newsletter.from_state(d) for d in raw]
+
+def _unwrap(result):
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+# -----------------------
+# State: encoding + backends (S3, local directory, SQLite)
+# -----------------------
+_GZIP_MAGIC = b"\x1f\x8b"
+
+def encode_state(payload) -> bytes:
+    """
+    STATE_FORMAT=compact: gzip'd minified JSON; a list of records becomes
+    {"_columnar": 1, "fields": [...], "rows": [[...], ...]} so field names are stored once.
+    Missing fields are stored as null (and come back missing).
+    """
+    if STATE_FORMAT != "compact":
+        return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    if isinstance(payload, list) and payload and all(isinstance(x, dict) for x in payload):
+        names = list(dict.fromkeys(k for x in payload for k in x))
+        payload = {"_columnar": 1, "fields": names, "rows": [[x.get(f) for f in names] for x in payload]}
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return gzip.compress(body, compresslevel=6)
+
+def decode_state(body: bytes):
+    """Inverse of `encode_state`; also reads the legacy plain-JSON objects."""
+    if body[:2] == _GZIP_MAGIC:
+        body = gzip.decompress(body)
+    if not body:
+        return []
+    doc = json.loads(body)
+    if isinstance(doc, dict) and doc.get("_columnar") == 1:
+        names = doc["fields"]
+        return [{f: v for f, v in zip(names, row) if v is not None} for row in doc["rows"]]
+    return doc
+
+class StateConflict(Exception):
+    """Another run wrote the state object after we loaded it; our write was rejected instead of clobbering it."""
+
+def _state_digest(payload) -> str:
+    canonical = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+_ANY_VERSION = object()  # `_write` precondition: key was never loaded, write unconditionally
+
+class StateBackend:
+    """
+    Key -> state document store. Subclasses implement `_read`/`_write` on raw bytes with an opaque
+    per-key version (S3 ETag, file digest, SQLite row counter); `load`/`save` add the encoding,
+    the skip-unchanged check and the optimistic-concurrency precondition on top.
+    """
+    def __init__(self):
+        # key -> {"version": as loaded/written (None = absent), "digest": canonical payload digest, "compact": bool}
+        self._meta: dict[str, dict] = {}
+        self._logs: dict[str, ChangeLog] = {}
+
+    def _read(self, key: str) -> tuple[bytes | None, object]:
+        """(body, version), or (None, None) if the key does not exist."""
+        raise NotImplementedError
+
+    def _write(self, key: str, body: bytes, expected, content_type: str) -> object:
+        """
+        Store `body` if the key's current version is `expected` (None = must not exist,
+        _ANY_VERSION = no check); return the new version, else raise StateConflict.
+        """
+        raise NotImplementedError
+
+    def list_keys(self, prefix: str) -> list[str]:
+        """Every stored key starting with `prefix`."""
+        raise NotImplementedError
+
+    def plot_store(self) -> PlotStore | None:
+        """Per-plot store for backends that have one; otherwise plots are one state document per unit."""
+        return None
+
+    def change_log(self, key: str) -> ChangeLog:
+        log = self._logs.get(key)
+        if log is None:
+            log = self._logs[key] = ChangeLog(self, key)
+        return log
+
+    def load(self, key: str):
+        """Load state; remembers the key's version and payload digest for `save`."""
+        body, version = self._read(key)
+        if body is None:
+            self._meta[key] = {"version": None, "digest": None, "compact": False}
             return []
-        raise
+        payload = decode_state(body)
+        self._meta[key] = {"version": version, "digest": _state_digest(payload), "compact": body[:2] == _GZIP_MAGIC}
+        return payload
 
-def save_json(s3_client: boto3.client, key: str, payload: list[dict[str, str]]) -> None:
-    s3_client.put_object(Bucket=BUCKET_NAME, Key=key, Body=json.dumps(payload, ensure_ascii=False))
+    def save(self, key: str, payload) -> None:
+        """
+        Skips the write when `payload` equals what `load` read (and is already in STATE_FORMAT).
+        Otherwise writes conditionally on the loaded version, so overlapping runs cannot silently
+        overwrite each other: raises StateConflict.
+        """
+        compact = STATE_FORMAT == "compact"
+        digest = _state_digest(payload)
+        meta = self._meta.get(key)
+        if meta and meta["digest"] == digest and meta["compact"] == compact:
+            logger.info("State unchanged; skipping write of %s", key)
+            return
+        version = self._write(
+            key,
+            encode_state(payload),
+            meta["version"] if meta else _ANY_VERSION,
+            "application/gzip" if compact else "application/json",
+        )
+        self._meta[key] = {"version": version, "digest": digest, "compact": compact}
+
+    def create(self, key: str, payload) -> None:
+        """Write a key that must not exist yet (append-only entries); raises StateConflict if it does."""
+        compact = STATE_FORMAT == "compact"
+        self._write(key, encode_state(payload), None, "application/gzip" if compact else "application/json")
+
+class S3Backend(StateBackend):
+    """One object per key under s3://bucket/prefix; preconditions map to If-Match / If-None-Match: *."""
+    def __init__(self, client: boto3.client, bucket: str, prefix: str = ""):
+        super().__init__()
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix
+
+    def __repr__(self):
+        return f"S3Backend(s3://{self.bucket}/{self.prefix})"
+
+    def _read(self, key):
+        from botocore.exceptions import ClientError
+
+        try:
+            resp = self.client.get_object(Bucket=self.bucket, Key=self.prefix + key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+                return None, None
+            raise
+        return resp["Body"].read(), resp.get("ETag")
+
+    def _write(self, key, body, expected, content_type):
+        from botocore.exceptions import ClientError
+
+        conditions = {}
+        if expected is not _ANY_VERSION:
+            conditions = {"IfMatch": expected} if expected else {"IfNoneMatch": "*"}
+        try:
+            resp = self.client.put_object(
+                Bucket=self.bucket, Key=self.prefix + key, Body=body, ContentType=content_type, **conditions
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("PreconditionFailed", "ConditionalRequestConflict", "412", "409"):
+                raise StateConflict(f"{key} was modified by another run since it was loaded") from e
+            raise
+        return resp.get("ETag")
+
+    def list_keys(self, prefix):
+        keys = []
+        for page in self.client.get_paginator("list_objects_v2").paginate(Bucket=self.bucket, Prefix=self.prefix + prefix):
+            keys.extend(obj["Key"][len(self.prefix):] for obj in page.get("Contents", []))
+        return keys
+
+class LocalBackend(StateBackend):
+    """
+    One file per key in a directory, replaced atomically (write to a temp file, then rename).
+    The version is a digest of the file's bytes; the check-and-replace is atomic between threads
+    of one process, not between processes.
+    """
+    def __init__(self, directory: str):
+        super().__init__()
+        self.directory = directory
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def __repr__(self):
+        return f"LocalBackend({self.directory})"
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    def _read_unlocked(self, key):
+        try:
+            with open(self._path(key), "rb") as f:
+                body = f.read()
+        except FileNotFoundError:
+            return None, None
+        return body, hashlib.blake2b(body, digest_size=16).hexdigest()
+
+    def _read(self, key):
+        with self._lock:
+            return self._read_unlocked(key)
+
+    def _write(self, key, body, expected, content_type):
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with self._lock:
+            if expected is not _ANY_VERSION and self._read_unlocked(key)[1] != expected:
+                raise StateConflict(f"{key} was modified by another run since it was loaded")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp, "wb") as f:
+                f.write(body)
+            os.replace(tmp, path)
+        return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+    def list_keys(self, prefix):
+        # Keys map to paths, so a prefix is a directory plus a file-name prefix.
+        directory, start = os.path.split(prefix)
+        try:
+            names = os.listdir(os.path.join(self.directory, directory))
+        except FileNotFoundError:
+            return []
+        return [
+            f"{directory}/{name}" if directory else name
+            for name in names
+            if name.startswith(start) and not name.endswith(".tmp")
+        ]
+
+class SQLiteBackend(StateBackend):
+    """
+    All keys in one SQLite file (WAL mode, so readers never block the writer); the version is a
+    per-row counter and the precondition is part of the UPDATE/INSERT, so it also holds across processes.
+    """
+    def __init__(self, path: str):
+        import sqlite3
+
+        super().__init__()
+        self.path = path
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS state ("
+            " key TEXT PRIMARY KEY, body BLOB NOT NULL, version INTEGER NOT NULL, updated_at REAL NOT NULL)"
+        )
+        # Created up front: unit pipelines call `plot_store()` from their own threads.
+        self._plots = PlotStore(self.conn, self._lock)
+
+    def __repr__(self):
+        return f"SQLiteBackend({self.path})"
+
+    def plot_store(self) -> PlotStore:
+        return self._plots
+
+    def _read(self, key):
+        with self._lock:
+            row = self.conn.execute("SELECT body, version FROM state WHERE key = ?", (key,)).fetchone()
+        return (bytes(row[0]), row[1]) if row else (None, None)
+
+    def _write(self, key, body, expected, content_type):
+        now = time.time()
+        with self._lock:
+            if expected is _ANY_VERSION:
+                row = self.conn.execute(
+                    "INSERT INTO state (key, body, version, updated_at) VALUES (?, ?, 1, ?)"
+                    " ON CONFLICT(key) DO UPDATE SET body = excluded.body, version = version + 1,"
+                    " updated_at = excluded.updated_at RETURNING version",
+                    (key, body, now),
+                ).fetchone()
+            elif expected is None:
+                row = self.conn.execute(
+                    "INSERT INTO state (key, body, version, updated_at) VALUES (?, ?, 1, ?)"
+                    " ON CONFLICT(key) DO NOTHING RETURNING version",
+                    (key, body, now),
+                ).fetchone()
+            else:
+                row = self.conn.execute(
+                    "UPDATE state SET body = ?, version = version + 1, updated_at = ?"
+                    " WHERE key = ? AND version = ? RETURNING version",
+                    (body, now, key, expected),
+                ).fetchone()
+        if row is None:
+            raise StateConflict(f"{key} was modified by another run since it was loaded")
+        return row[0]
+
+    def list_keys(self, prefix):
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT key FROM state WHERE substr(key, 1, ?) = ?", (len(prefix), prefix)
+            ).fetchall()
+        return [r[0] for r in rows]
+
+def open_state_backend(uri: str) -> StateBackend:
+    """
+    "s3://bucket[/prefix]", "sqlite:///relative.db" / "sqlite:////absolute.db",
+    "file:///absolute/dir" or a plain directory path.
+    """
+    if uri.startswith("s3://"):
+        bucket, _, prefix = uri[len("s3://"):].partition("/")
+        if prefix and not prefix.endswith("/"):
+            prefix += "/"
+        return S3Backend(s3_client(), bucket, prefix)
+    if uri.startswith("sqlite:///"):
+        return SQLiteBackend(uri[len("sqlite:///"):])
+    if uri.startswith("file://"):
+        return LocalBackend(urlsplit(uri).path)
+    if "://" in uri:
+        raise ValueError(f"Unsupported STATE_URI scheme: {uri}")
+    return LocalBackend(uri)
+
+def state_backend() -> StateBackend:
+    """The configured backend (STATE_URI, else s3://BUCKET_NAME), reused across warm invocations."""
+    return _client("state", lambda: open_state_backend(STATE_URI or f"s3://{BUCKET_NAME}"))
+
+def load_json(store: StateBackend, key: str) -> list[dict[str, str]]:
+    return store.load(key)
+
+def save_json(store: StateBackend, key: str, payload: list[dict[str, str]]) -> None:
+    store.save(key, payload)
 
 # -----------------------
-# Telegram notifications (per-item)
+# State: append-only change log with snapshot compaction (plots/news history)
+# -----------------------
+_LOG_ENTRY_RE = re.compile(r"/(snapshot|log)-(\d{13})-\w+\.json$")
+
+def _ms(at: float) -> str:
+    return f"{int(at * 1000):013d}"
+
+def _history_prefix(key: str) -> str:
+    return (key[:-len(".json")] if key.endswith(".json") else key) + "/"
+
+class ChangeLog:
+    """
+    History of one record list (records keyed by "id"), stored under "<key without .json>/":
+      snapshot-<ms>-<n>.json  the full list at that time; written instead of every STATE_COMPACT_EVERY-th log entry
+      log-<ms>-<n>.json       one per other run with changes: {"at", "upsert": [records], "delete": [ids]}
+    A run writes only its changes; entries are never overwritten, so state at any past time is
+    the latest snapshot at or before it plus the log entries after that snapshot.
+    """
+    def __init__(self, store: StateBackend, key: str):
+        self.store = store
+        self.key = key
+        self.prefix = _history_prefix(key)
+        self._loaded: dict[str, dict] | None = None  # id -> record as of `load()`
+        self._since_snapshot = 0
+        self._has_snapshot = False
+
+    def _entries(self) -> list[tuple[str, str, str]]:
+        """(ms, kind, key) for every entry, oldest first."""
+        entries = []
+        for k in self.store.list_keys(self.prefix):
+            m = _LOG_ENTRY_RE.search(k)
+            if m:
+                # At equal timestamps a snapshot already includes its run's log entry: sort it last.
+                entries.append((m.group(2), m.group(1) == "snapshot", k))
+        entries.sort()
+        return [(ms, "snapshot" if snap else "log", k) for ms, snap, k in entries]
+
+    def _replay(self, until_ms: str | None) -> tuple[dict[str, dict], int, bool]:
+        entries = [e for e in self._entries() if until_ms is None or e[0] <= until_ms]
+        start = max((i for i, e in enumerate(entries) if e[1] == "snapshot"), default=None)
+        if start is not None:
+            records = {r["id"]: r for r in self.store.load(entries[start][2]) if r.get("id")}
+            tail = entries[start + 1:]
+        elif until_ms is None and not entries:
+            # Nothing logged yet: start from the pre-log state document, if there is one.
+            records = {r["id"]: r for r in self.store.load(self.key) if r.get("id")}
+            tail = []
+        else:
+            records, tail = {}, entries
+        for _, kind, k in tail:
+            if kind != "log":
+                continue
+            change = self.store.load(k)
+            for rid in change.get("delete", []):
+                records.pop(rid, None)
+            for r in change.get("upsert", []):
+                records[r["id"]] = r
+        return records, len(tail), start is not None
+
+    def load(self) -> list[dict[str, str]]:
+        """Current state; remembered as the base `append` diffs against."""
+        records, self._since_snapshot, self._has_snapshot = self._replay(None)
+        self._loaded = records
+        return list(records.values())
+
+    def state_at(self, at: float) -> list[dict[str, str]]:
+        """State as of `at` (epoch seconds)."""
+        return list(self._replay(_ms(at))[0].values())
+
+    def append(self, current: list[dict[str, str]], at: float | None = None) -> bool:
+        """
+        Log the difference between `load()` and `current` (one small object); compacts into a new
+        snapshot every STATE_COMPACT_EVERY entries. Returns False when nothing changed and nothing was written.
+        """
+        if self._loaded is None:
+            self.load()
+        at = time.time() if at is None else at
+        now = {r["id"]: r for r in current if r.get("id")}
+        upsert = [r for rid, r in now.items() if self._loaded.get(rid) != r]
+        delete = [rid for rid in self._loaded if rid not in now]
+        if not upsert and not delete and self._has_snapshot:
+            logger.info("State unchanged; nothing to log for %s", self.key)
+            return False
+
+        suffix = os.urandom(3).hex()
+        if not self._has_snapshot or self._since_snapshot + 1 >= STATE_COMPACT_EVERY:
+            # Compaction: the snapshot stands in for this run's log entry.
+            self.store.create(f"{self.prefix}snapshot-{_ms(at)}-{suffix}.json", list(now.values()))
+            self._since_snapshot = 0
+            self._has_snapshot = True
+        else:
+            self.store.create(f"{self.prefix}log-{_ms(at)}-{suffix}.json", {"at": at, "upsert": upsert, "delete": delete})
+            self._since_snapshot += 1
+        self._loaded = now
+        return True
+
+def last_plot_run(store: StateBackend, key: str) -> float | None:
+    """When the plots in `key` were last checked (stamped as "last_seen" on plots that then disappear)."""
+    marker = store.load(f"{_history_prefix(key)}last_run.json")
+    return marker.get("at") if isinstance(marker, dict) else None
+
+def mark_plot_run(store: StateBackend, key: str, at: float) -> None:
+    store.save(f"{_history_prefix(key)}last_run.json", {"at": at})
+
+def load_state(store: StateBackend, key: str) -> list[dict[str, str]]:
+    """Plots/news state for `key`: replayed from its change log, or the single document (STATE_LAYOUT=document)."""
+    if STATE_LAYOUT != "log":
+        return load_json(store, key)
+    return store.change_log(key).load()
+
+def save_state(store: StateBackend, key: str, records: list[dict[str, str]]) -> None:
+    if STATE_LAYOUT != "log":
+        save_json(store, key, records)
+    else:
+        store.change_log(key).append(records)
+
+def state_at(store: StateBackend, key: str, at: float) -> list[dict[str, str]]:
+    """Plots/news state for `key` as it was at `at` (epoch seconds); needs STATE_LAYOUT=log history."""
+    return ChangeLog(store, key).state_at(at)
+
+# -----------------------
+# Change detection: per-record fingerprints, added / modified / removed in one pass
+# -----------------------
+# Fields of a plot that make up its fingerprint (detail_url is a link, not auction data).
+PLOT_TRACKED_FIELDS = (
+    "title", "scheme_name", "property_number", "area", "usage_type",
+    "emd_start", "emd_end", "emd_amount", "bid_start", "bid_end", "assessed_value",
+)
+def _norm_field(val) -> str:
+    return _WS_RE.sub(" ", str(val or "")).strip()
+
+def record_fingerprint(p: Plot, tracked: tuple[str, ...] = PLOT_TRACKED_FIELDS) -> str:
+    """Digest of the normalized tracked fields; equal fingerprints mean no field changed."""
+    joined = "\x1f".join(_norm_field(getattr(p, f)) for f in tracked)
+    return hashlib.blake2b(joined.encode("utf-8"), digest_size=8).hexdigest()
+
+def field_changes(old: Plot, new: Plot, tracked: tuple[str, ...] = PLOT_TRACKED_FIELDS) -> dict[str, list]:
+    """{field: [old, new]} for the tracked fields that differ; only called once fingerprints disagree."""
+    changes = {}
+    for f in tracked:
+        before, after = getattr(old, f), getattr(new, f)
+        if _norm_field(before) != _norm_field(after):
+            changes[f] = [before, after]
+    return changes
+
+def diff_plots(prev: list[Plot], current: list[Plot]) -> dict[str, list]:
+    """
+    {"added": [plot], "relisted": [{"plot", "relisted", "removed_at"}], "modified": [{"plot", "fp", "changes"}],
+    "removed": [previous plot]} in one pass over `current`. Previous plots carry their fingerprint in `fp`
+    (computed here for older state); tombstones (`removed_at` set) that reappear are relisted, not added.
+    """
+    prev_by_id = {x.id: x for x in prev if x.id}
+    seen = set()
+    added, relisted, modified = [], [], []
+    for p in current:
+        pid = p.id
+        if not pid or pid in seen:
+            continue
+        seen.add(pid)
+        old = prev_by_id.get(pid)
+        if old is None:
+            added.append(p)
+            continue
+        if old.removed_at is not None:
+            relisted.append({"plot": p, "relisted": (old.relisted or 0) + 1, "removed_at": old.removed_at})
+            continue
+        fp = record_fingerprint(p)
+        if (old.fp or record_fingerprint(old)) != fp:
+            modified.append({"plot": p, "fp": fp, "changes": field_changes(old, p)})
+    removed = [x for pid, x in prev_by_id.items() if pid not in seen and x.removed_at is None]
+    return {"added": added, "relisted": relisted, "modified": modified, "removed": removed}
+
+def next_plot_state(
+    prev: list[Plot],
+    current: list[Plot],
+    now: float,
+    last_run_at: float | None = None,
+) -> list[Plot]:
+    """
+    State to store after a run: the current plots with "fp" and lifecycle fields ("first_seen", "relisted"
+    count), plus tombstones for plots no longer listed ("removed_at" = this run, "last_seen" = the previous
+    run). Records only change when their plot does, so the change log stays proportional to changes.
+    Tombstones older than PLOT_TOMBSTONE_DAYS are dropped.
+    """
+    prev_by_id = {x.id: x for x in prev if x.id}
+    horizon = now - PLOT_TOMBSTONE_DAYS * 86400
+    out, seen = [], set()
+    for p in current:
+        pid = p.id
+        if not pid or pid in seen:
+            continue
+        seen.add(pid)
+        old = prev_by_id.get(pid)
+        first_seen, relisted = now, None
+        if old is not None:
+            first_seen = old.first_seen if old.first_seen is not None else now
+            relisted = (old.relisted or 0) + (1 if old.removed_at is not None else 0) or None
+        out.append(replace(p, fp=record_fingerprint(p), first_seen=first_seen, relisted=relisted))
+    for pid, old in prev_by_id.items():
+        if pid in seen:
+            continue
+        if old.removed_at is None:
+            old = replace(old, removed_at=now, last_seen=last_run_at or old.last_seen)
+        if old.removed_at >= horizon:
+            out.append(old)
+    return out
+
+# -----------------------
+# State: SQLite plot store (per-plot rows instead of one document per unit)
+# -----------------------
+class PlotStore:
+    """
+    Plots keyed by (unit, id) in the SQLite state file. A run touches only the rows of the plots
+    on the current pages: "which IDs are new" / "which fingerprints changed" are joins against a
+    temp table of this run's (id, fp), and the current plots are written back with one batched upsert.
+    IDs that drop off the listing are tombstoned (removed_at) rather than forgotten, and a tombstoned ID
+    that comes back is relisted; tombstones older than PLOT_TOMBSTONE_DAYS are purged.
+    """
+    def __init__(self, conn, lock: threading.Lock):
+        self.conn = conn
+        self._lock = lock
+        with self._lock:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS plots ("
+                " unit TEXT NOT NULL, id TEXT NOT NULL, scheme_name TEXT, record TEXT NOT NULL,"
+                " first_seen REAL NOT NULL, last_seen REAL NOT NULL, fp TEXT, removed_at REAL,"
+                " relisted INTEGER NOT NULL DEFAULT 0, PRIMARY KEY (unit, id)) WITHOUT ROWID"
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS plots_by_scheme ON plots (unit, scheme_name)")
+
+    def has_unit(self, unit: str) -> bool:
+        with self._lock:
+            return self.conn.execute("SELECT 1 FROM plots WHERE unit = ? LIMIT 1", (unit,)).fetchone() is not None
+
+    def new_ids(self, unit: str, ids: list[str]) -> set[str]:
+        """The subset of `ids` never stored for `unit`."""
+        with self._lock:
+            self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS run_ids (id TEXT PRIMARY KEY) WITHOUT ROWID")
+            self.conn.execute("DELETE FROM run_ids")
+            self.conn.executemany("INSERT OR IGNORE INTO run_ids (id) VALUES (?)", ((i,) for i in ids))
+            rows = self.conn.execute(
+                "SELECT r.id FROM run_ids r LEFT JOIN plots p ON p.unit = ? AND p.id = r.id WHERE p.id IS NULL",
+                (unit,),
+            ).fetchall()
+        return {r[0] for r in rows}
+
+    def diff(self, unit: str, plots: list[Plot]) -> dict[str, list]:
+        """
+        Same result as `diff_plots(<stored plots>, plots)`, reading only stored rows whose fingerprint
+        differs or that are tombstoned. "removed" = listed plots (not tombstoned) missing from `plots`.
+        """
+        current = {}
+        for p in plots:
+            if p.id:
+                current.setdefault(p.id, p)
+        fps = {pid: record_fingerprint(p) for pid, p in current.items()}
+        with self._lock:
+            self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS run_plots (id TEXT PRIMARY KEY, fp TEXT) WITHOUT ROWID")
+            self.conn.execute("DELETE FROM run_plots")
+            self.conn.executemany("INSERT INTO run_plots (id, fp) VALUES (?, ?)", fps.items())
+            changed = self.conn.execute(
+                "SELECT r.id, p.id IS NULL, p.fp, p.record, p.removed_at, p.relisted FROM run_plots r"
+                " LEFT JOIN plots p ON p.unit = ? AND p.id = r.id WHERE p.fp IS NOT r.fp OR p.removed_at IS NOT NULL",
+                (unit,),
+            ).fetchall()
+            removed = self.conn.execute(
+                "SELECT record FROM plots p WHERE unit = ? AND removed_at IS NULL"
+                " AND NOT EXISTS (SELECT 1 FROM run_plots r WHERE r.id = p.id)",
+                (unit,),
+            ).fetchall()
+
+        added_ids, relisted, modified = set(), [], []
+        for pid, is_new, old_fp, old_record, removed_at, relisted_count in changed:
+            if is_new:
+                added_ids.add(pid)
+                continue
+            if removed_at is not None:
+                relisted.append({"plot": current[pid], "relisted": relisted_count + 1, "removed_at": removed_at})
+                continue
+            old = Plot.from_state(json.loads(old_record))
+            if (old_fp or record_fingerprint(old)) != fps[pid]:
+                modified.append({"plot": current[pid], "fp": fps[pid], "changes": field_changes(old, current[pid])})
+        return {
+            "added": [p for pid, p in current.items() if pid in added_ids],
+            "relisted": relisted,
+            "modified": modified,
+            "removed": [Plot.from_state(json.loads(r[0])) for r in removed],
+        }
+
+    def upsert(self, unit: str, plots: list[Plot], seen_at: float | None = None) -> None:
+        """
+        Store `plots` as seen at `seen_at`; a tombstoned ID among them is revived and its relisted count bumped.
+        Lifecycle fields already on a record (state documents seeded by the first run) are kept.
+        """
+        seen_at = time.time() if seen_at is None else seen_at
+        rows = [
+            (
+                unit, p.id, p.scheme_name, json.dumps(p.to_state(), ensure_ascii=False, separators=(",", ":")),
+                p.first_seen or seen_at, p.last_seen or seen_at, record_fingerprint(p),
+                p.removed_at, p.relisted or 0,
+            )
+            for p in plots if p.id
+        ]
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                self.conn.executemany(
+                    "INSERT INTO plots (unit, id, scheme_name, record, first_seen, last_seen, fp, removed_at, relisted)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                    " ON CONFLICT(unit, id) DO UPDATE SET scheme_name = excluded.scheme_name,"
+                    " record = excluded.record, last_seen = excluded.last_seen, fp = excluded.fp,"
+                    " relisted = plots.relisted + (plots.removed_at IS NOT NULL AND excluded.removed_at IS NULL),"
+                    " removed_at = excluded.removed_at",
+                    rows,
+                )
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+
+    def retire(self, unit: str, seen_at: float) -> None:
+        """After `upsert(unit, plots, seen_at)`: tombstone the unit's listed plots it did not touch, purge old tombstones."""
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                self.conn.execute(
+                    "UPDATE plots SET removed_at = ? WHERE unit = ? AND removed_at IS NULL AND last_seen < ?",
+                    (seen_at, unit, seen_at),
+                )
+                self.conn.execute(
+                    "DELETE FROM plots WHERE unit = ? AND removed_at < ?",
+                    (unit, seen_at - PLOT_TOMBSTONE_DAYS * 86400),
+                )
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+
+    def by_scheme(self, unit: str, scheme_name: str) -> list[Plot]:
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT record FROM plots WHERE unit = ? AND scheme_name = ? ORDER BY id", (unit, scheme_name)
+            ).fetchall()
+        return [Plot.from_state(json.loads(r[0])) for r in rows]
+
+    def get(self, unit: str, plot_id: str) -> Plot | None:
+        with self._lock:
+            row = self.conn.execute("SELECT record FROM plots WHERE unit = ? AND id = ?", (unit, plot_id)).fetchone()
+        return Plot.from_state(json.loads(row[0])) if row else None
+
+# -----------------------
+# Notifications: message builders, rate-limited sinks (Telegram chats, webhooks)
 # -----------------------
 def _fmt(val: str | None) -> str:
     return (val or "").strip()
 
-def _build_plot_message_html(p: dict[str, str]) -> str:
+def _build_plot_message_html(p: Plot, unit: str = DEFAULT_UNIT, heading: str = "New Plot") -> str:
     link_html = ""
-    if p.get("detail_url"):
-        link_html = f'\n<a href="{_fmt(p["detail_url"])}">🔗 View Plot Details</a>'
+    if p.detail_url:
+        link_html = f'\n<a href="{_fmt(p.detail_url)}">🔗 View Plot Details</a>'
 
     parts = [
-        f"🏗️ <b>UIT, Alwar – New Plot</b>",
-        f"🆔 <b>ID:</b> {_fmt(p.get('id'))}",
-        f"🏷️ <b>Title:</b> {_fmt(p.get('title'))}",
-        f"📍 <b>Scheme:</b> {_fmt(p.get('scheme_name'))}",
-        f"🏢 <b>Property #:</b> {_fmt(p.get('property_number'))}",
-        f"📐 <b>Area:</b> {_fmt(p.get('area'))}",
-        f"🏢 <b>Usage:</b> {_fmt(p.get('usage_type'))}",
-        f"📅 <b>EMD:</b> {_fmt(p.get('emd_start'))} → {_fmt(p.get('emd_end'))}  (Amt: {_fmt(p.get('emd_amount'))})",
-        f"📅 <b>Bid:</b> {_fmt(p.get('bid_start'))} → {_fmt(p.get('bid_end'))}",
-        f"💰 <b>Assessed Value:</b> {_fmt(p.get('assessed_value'))}",
+        f"🏗️ <b>{unit} – {heading}</b>",
+        f"🆔 <b>ID:</b> {_fmt(p.id)}",
+        f"🏷️ <b>Title:</b> {_fmt(p.title)}",
+        f"📍 <b>Scheme:</b> {_fmt(p.scheme_name)}",
+        f"🏢 <b>Property #:</b> {_fmt(p.property_number)}",
+        f"📐 <b>Area:</b> {_fmt(p.area)}",
+        f"🏢 <b>Usage:</b> {_fmt(p.usage_type)}",
+        f"📅 <b>EMD:</b> {_fmt(p.emd_start)} → {_fmt(p.emd_end)}  (Amt: {_fmt(p.emd_amount)})",
+        f"📅 <b>Bid:</b> {_fmt(p.bid_start)} → {_fmt(p.bid_end)}",
+        f"💰 <b>Assessed Value:</b> {_fmt(p.assessed_value)}",
     ]
     return "\n".join(parts) + link_html
 
-def _build_news_message_html(n: dict[str, str]) -> str:
+_PLOT_FIELD_LABELS = {
+    "title": "Title",
+    "scheme_name": "Scheme",
+    "property_number": "Property #",
+    "area": "Area",
+    "usage_type": "Usage",
+    "emd_start": "EMD Start",
+    "emd_end": "EMD End",
+    "emd_amount": "EMD Amount",
+    "bid_start": "Bid Start",
+    "bid_end": "Bid End",
+    "assessed_value": "Assessed Value",
+}
+
+def _build_plot_relisted_message_html(m: dict, unit: str = DEFAULT_UNIT) -> str:
+    """`m` is a "relisted" entry of `diff_plots`: {"plot", "relisted": count, "removed_at"}."""
+    removed = datetime.datetime.fromtimestamp(m["removed_at"]).strftime("%d-%m-%Y")
+    times = f", {m['relisted']}x" if m["relisted"] > 1 else ""
+    return _build_plot_message_html(m["plot"], unit, heading=f"Relisted Plot (delisted {removed}{times})")
+
+def _build_plot_change_message_html(m: dict, unit: str = DEFAULT_UNIT) -> str:
+    """`m` is a "modified" entry of `diff_plots`: {"plot", "fp", "changes": {field: [old, new]}}."""
+    p = m["plot"]
+    parts = [
+        f"✏️ <b>{unit} – Plot Updated</b>",
+        f"🆔 <b>ID:</b> {_fmt(p.id)}",
+        f"🏷️ <b>Title:</b> {_fmt(p.title)}",
+    ]
+    for name, (old, new) in m["changes"].items():
+        parts.append(f"• <b>{_PLOT_FIELD_LABELS.get(name, name)}:</b> {_fmt(old) or '—'} → {_fmt(new) or '—'}")
+    if p.detail_url:
+        parts.append(f'<a href="{_fmt(p.detail_url)}">🔗 View Plot Details</a>')
+    return "\n".join(parts)
+
+def _build_news_message_html(n: Newsletter) -> str:
     parts = [
         "📰 <b>UIT, Alwar – New Auction Newsletter</b>",
-        f"📅 <b>Auction Date:</b> { _fmt(n.get('date')) }",
-        f"📄 <b>Detail:</b> { _fmt(n.get('detail')) }",
-        f"📍 <b>Venue & Time:</b> { _fmt(n.get('venue_time')) }",
+        f"📅 <b>Auction Date:</b> { _fmt(n.date) }",
+        f"📄 <b>Detail:</b> { _fmt(n.detail) }",
+        f"📍 <b>Venue & Time:</b> { _fmt(n.venue_time) }",
     ]
-    url = _fmt(n.get("url"))
-    title = _fmt(n.get("title")) or "View Document"
+    url = _fmt(n.url)
+    title = _fmt(n.title) or "View Document"
     if url:
         parts.append(f'<a href="{url}">📄 {title}</a>')
     return "\n".join(parts)
 
-def send_telegram_message(text):
-    if not TELEGRAM_BOT_TOKEN or not TELEGRAM_CHAT_ID:
-        logger.warning("Telegram not configured")
-        return
-    url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
-    requests.post(url, data={
-        "chat_id": TELEGRAM_CHAT_ID,
-        "text": text,
-        "parse_mode": "HTML",
-        "disable_web_page_preview": True
-    })
+class TokenBucket:
+    """
+    Thread-safe token bucket: refills `rate` tokens/s up to `capacity`.
+    `pause()` empties it until a server-imposed back-off (e.g. 429 retry_after) has elapsed.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now >= self.blocked_until:
+                    self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                    self.updated = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.rate
+                else:
+                    wait = self.blocked_until - now
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+            self.updated = self.blocked_until
+            # One send is allowed as soon as the back-off ends; the refill resumes from there.
+            self.tokens = 1.0
+
+_telegram_global_bucket = TokenBucket(TELEGRAM_GLOBAL_PER_SEC, TELEGRAM_GLOBAL_PER_SEC)
+_sink_buckets: dict[str, TokenBucket] = {}
+_sink_buckets_lock = threading.Lock()
+
+def _sink_bucket(name: str, min_interval_ms: int, burst: int = 1) -> TokenBucket:
+    """Per-destination bucket, kept across runs so warm invocations stay paced."""
+    with _sink_buckets_lock:
+        bucket = _sink_buckets.get(name)
+        if bucket is None:
+            bucket = _sink_buckets[name] = TokenBucket(1000.0 / max(min_interval_ms, 1), burst)
+    return bucket
+
+def _retry_after(resp: requests.Response) -> float:
+    """Seconds the server asks us to wait: Telegram's `parameters.retry_after`, else Retry-After, else 1."""
+    try:
+        return float(resp.json()["parameters"]["retry_after"])
+    except Exception:
+        try:
+            return float(resp.headers.get("Retry-After", 1))
+        except ValueError:
+            return 1.0
 
-def send_telegram_messages(items: list[dict[str, str]], builder) -> None:
+class Sink:
     """
-    Send one message per item using `builder(item) -> HTML text`.
+    A notification destination. `send()` is paced by the sink's own token bucket (plus `global_bucket`
+    if set); 429s are retried after `retry_after`, 5xx/network errors with exponential back-off.
+    Raises once TELEGRAM_MAX_RETRIES is exhausted or on any other 4xx.
     """
-    if not (TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID):
-        logger.warning("Telegram creds not set; skipping notification step.")
+
+    global_bucket: TokenBucket | None = None
+
+    def __init__(self, name: str, bucket: TokenBucket):
+        self.name = name
+        self.bucket = bucket
+
+    def _post(self, text: str) -> requests.Response:
+        raise NotImplementedError
+
+    def send(self, text: str) -> None:
+        import requests
+
+        for attempt in range(TELEGRAM_MAX_RETRIES + 1):
+            last_attempt = attempt == TELEGRAM_MAX_RETRIES
+            self.bucket.acquire()
+            if self.global_bucket:
+                self.global_bucket.acquire()
+            try:
+                r = self._post(text)
+            except requests.RequestException as e:
+                if last_attempt:
+                    raise
+                logger.warning("%s send failed (%s); retrying in %ss", self.name, e, 2 ** attempt)
+                self.bucket.pause(2 ** attempt)
+                continue
+            if not last_attempt and (r.status_code == 429 or r.status_code >= 500):
+                delay = _retry_after(r) if r.status_code == 429 else 2 ** attempt
+                logger.warning("%s returned %s; retrying in %ss", self.name, r.status_code, delay)
+                self.bucket.pause(delay)
+                continue
+            r.raise_for_status()
+            return
+
+class TelegramSink(Sink):
+    global_bucket = _telegram_global_bucket
+
+    def __init__(self, chat_id: str):
+        name = f"telegram:{chat_id}"
+        super().__init__(name, _sink_bucket(name, TELEGRAM_MIN_INTERVAL_MS, TELEGRAM_CHAT_BURST))
+        self.chat_id = chat_id
+
+    def _post(self, text: str) -> requests.Response:
+        return notify_session().post(
+            f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage",
+            data={
+                "chat_id": self.chat_id,
+                "text": text,
+                "parse_mode": "HTML",
+                "disable_web_page_preview": True,
+            },
+            timeout=20,
+        )
+
+class WebhookSink(Sink):
+    def __init__(self, url: str):
+        # Named by digest so URL secrets never end up in logs or the outbox.
+        name = f"webhook:{hashlib.sha256(url.encode('utf-8')).hexdigest()[:12]}"
+        super().__init__(name, _sink_bucket(name, WEBHOOK_MIN_INTERVAL_MS))
+        self.url = url
+
+    def _post(self, text: str) -> requests.Response:
+        return notify_session().post(self.url, json={"text": text, "parse_mode": "HTML"}, timeout=20)
+
+def configured_sinks() -> list[Sink]:
+    sinks: list[Sink] = []
+    if TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID:
+        sinks += [TelegramSink(c.strip()) for c in TELEGRAM_CHAT_ID.split(",") if c.strip()]
+    sinks += [WebhookSink(u.strip()) for u in WEBHOOK_URLS.split(",") if u.strip()]
+    return sinks
+
+def _fan_out(sinks: list[Sink], work) -> list:
+    """`work(sink)` for every sink concurrently; one slow or failing destination never holds up the others."""
+    if len(sinks) <= 1:
+        return [work(sink) for sink in sinks]
+    with ThreadPoolExecutor(max_workers=len(sinks), thread_name_prefix="sink") as pool:
+        return list(pool.map(work, sinks))
+
+def broadcast(text: str) -> None:
+    """Best-effort status message to every destination (not queued in the outbox)."""
+    sinks = configured_sinks()
+    if not sinks:
+        logger.warning("Notifications not configured")
         return
 
-    url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
-    sent = 0
-    for it in items:
-        if sent >= TELEGRAM_MAX_MESSAGES:
-            logger.warning("Hit TELEGRAM_MAX_MESSAGES cap (%s). Not sending more.", TELEGRAM_MAX_MESSAGES)
-            break
-
-        msg = builder(it)
-        payload = {
-            "chat_id": TELEGRAM_CHAT_ID,
-            "text": msg,
-            "parse_mode": "HTML",
-            "disable_web_page_preview": True,
-        }
+    def send(sink: Sink) -> None:
         try:
-            r = requests.post(url, data=payload, timeout=20)
-            r.raise_for_status()
-            sent += 1
-            logger.info("Sent Telegram message for item id=%s", it.get("id"))
+            sink.send(text)
         except Exception as e:
-            logger.warning("Failed to send Telegram message for item id=%s: %s", it.get("id"), e)
+            logger.warning("Failed to send message to %s: %s", sink.name, e)
+
+    _fan_out(sinks, send)
 
-        time.sleep(TELEGRAM_MESSAGE_DELAY_MS / 1000.0)
+def _tg_len(text: str) -> int:
+    # Telegram measures message length in UTF-16 code units (emoji count as 2).
+    return len(text.encode("utf-16-le")) // 2
+
+_DIGEST_SEP = "\n\n"
+
+def _pack_groups(texts: list[str], limit: int = TELEGRAM_TEXT_LIMIT, sep: str = _DIGEST_SEP) -> list[list[int]]:
+    """
+    Greedily group item indexes into as few messages of at most `limit` as possible.
+    Items are never split, so their HTML tags stay balanced; an item longer than `limit` goes out alone.
+    Raw HTML length over-counts what Telegram measures (tags are stripped), so packed messages always fit.
+    """
+    groups: list[list[int]] = []
+    cur: list[int] = []
+    cur_len = 0
+    sep_len = _tg_len(sep)
+    for i, text in enumerate(texts):
+        n = _tg_len(text)
+        if cur and cur_len + sep_len + n > limit:
+            groups.append(cur)
+            cur, cur_len = [], 0
+        if n > limit:
+            logger.warning("Single item exceeds Telegram's %d-char limit (%d)", limit, n)
+        cur_len += (sep_len if cur else 0) + n
+        cur.append(i)
+    if cur:
+        groups.append(cur)
+    return groups
 
 # -----------------------
-# Main handler
+# Notification outbox (S3): new-item messages survive send failures and Lambda timeouts
 # -----------------------
-def lambda_handler(event, context):
-    if not BUCKET_NAME:
-        logger.error("Missing BUCKET_NAME")
-        return {"statusCode": 500, "body": "Missing BUCKET_NAME"}
+_outbox: dict = {"pending": [], "sent": {}}
+_outbox_lock = threading.Lock()
+_outbox_conflict = threading.Event()  # set once another run wrote the outbox after this one loaded it
 
-    session = requests.Session()
-    s3 = boto3.client("s3")
+def load_outbox(store: StateBackend) -> None:
+    """Load pending messages and recently delivered keys (older than OUTBOX_SENT_TTL_DAYS are forgotten)."""
+    stored = load_json(store, OBJECT_KEY_OUTBOX) or {}
+    _outbox_conflict.clear()
+    cutoff = time.time() - OUTBOX_SENT_TTL_DAYS * 86400
+    with _outbox_lock:
+        _outbox["pending"] = list(stored.get("pending") or [])
+        _outbox["sent"] = {k: ts for k, ts in (stored.get("sent") or {}).items() if ts >= cutoff}
+    if _outbox["pending"]:
+        logger.info("Outbox: %d message(s) pending from earlier runs", len(_outbox["pending"]))
+
+def save_outbox(store: StateBackend) -> None:
+    # Held across the PUT: pipelines save concurrently, and each conditional write must see the previous ETag.
+    with _outbox_lock:
+        if _outbox_conflict.is_set():
+            raise StateConflict(f"{OBJECT_KEY_OUTBOX} was modified by another run; this run's copy was discarded")
+        snapshot = {"pending": list(_outbox["pending"]), "sent": dict(_outbox["sent"])}
+        try:
+            save_json(store, OBJECT_KEY_OUTBOX, snapshot)
+        except StateConflict:
+            # An overlapping run owns the outbox now and delivers what it holds: forget this run's copy
+            # (incl. what it just queued), so nothing here is sent twice or written back over the other run.
+            _outbox_conflict.set()
+            _outbox["pending"] = []
+            _outbox["sent"] = {}
+            raise
+
+def enqueue_notifications(items: list, builder, key_prefix: str, key_of=lambda it: it.id) -> int:
+    """
+    Queue `builder(item)` for every item and every configured sink under the idempotency key
+    "<key_prefix>:<key_of(item)>" (default: the item's id). Keys already pending or delivered
+    are skipped, so re-detected items never double-post.
+    """
+    sink_names = [sink.name for sink in configured_sinks()]
+    if not sink_names:
+        logger.warning("Notification sinks not set; skipping notification step.")
+        return 0
+
+    now = time.time()
+    queued = 0
+    with _outbox_lock:
+        known = {m["key"] for m in _outbox["pending"]} | _outbox["sent"].keys()
+        for it in items:
+            key = f"{key_prefix}:{key_of(it)}"
+            if key in known:
+                continue
+            known.add(key)
+            _outbox["pending"].append({
+                "key": key, "text": builder(it), "sinks": sink_names, "created": now, "attempts": 0,
+            })
+            queued += 1
+    return queued
+
+def forget_superseded(keys: list[str], sep: str = "@") -> None:
+    """
+    For each "<prefix><sep><version>" key, forget delivered keys with the same prefix and another version,
+    so a version that comes back later (A -> B -> A -> B) is announced again. `keys` themselves are kept,
+    so re-detecting the same change still does not double-post.
+    """
+    current = {key.rpartition(sep)[0]: key for key in keys}
+    with _outbox_lock:
+        sent = _outbox["sent"]
+        for key in [k for k in sent if k.rpartition(sep)[0] in current]:
+            if key != current[key.rpartition(sep)[0]]:
+                del sent[key]
 
-    # Initialize default values
+def _drain_sink(sink: Sink, pending: list[dict]) -> int:
+    """Deliver `pending` (oldest first, packed when TELEGRAM_DIGEST is on) to one sink. Returns items delivered."""
+    if TELEGRAM_DIGEST:
+        batches = [[pending[i] for i in group] for group in _pack_groups([m["text"] for m in pending])]
+    else:
+        batches = [[m] for m in pending[:TELEGRAM_MAX_MESSAGES]]
+        if len(pending) > TELEGRAM_MAX_MESSAGES:
+            logger.warning(
+                "Hit TELEGRAM_MAX_MESSAGES cap (%s) for %s. %d message(s) stay queued for the next run.",
+                TELEGRAM_MAX_MESSAGES, sink.name, len(pending) - TELEGRAM_MAX_MESSAGES,
+            )
+
+    return sum(_send_batch(sink, batch) for batch in batches)
+
+def _rejected(e: Exception) -> bool:
+    """A 4xx other than 429: the message itself was refused (e.g. bad HTML), retrying it as is cannot help."""
+    resp = getattr(e, "response", None)
+    return resp is not None and 400 <= resp.status_code < 500 and resp.status_code != 429
+
+def _send_batch(sink: Sink, batch: list[dict]) -> int:
+    """One message for `batch`; a rejected digest is resent item by item so only the bad item is charged."""
+    keys = [m["key"] for m in batch]
+    try:
+        sink.send(_DIGEST_SEP.join(m["text"] for m in batch))
+    except Exception as e:
+        if len(batch) > 1 and _rejected(e):
+            logger.warning("%s rejected the digest for %s (%s); sending its items one by one", sink.name, keys, e)
+            return sum(_send_batch(sink, [m]) for m in batch)
+        logger.warning("Failed to send message for %s to %s: %s", keys, sink.name, e)
+        with _outbox_lock:
+            for m in batch:
+                m["failed"] = True
+        return 0
+    logger.info("Sent message for %s to %s", keys, sink.name)
+    with _outbox_lock:
+        for m in batch:
+            m["sinks"] = [name for name in m["sinks"] if name != sink.name]
+    return len(batch)
+
+def drain_outbox() -> int:
+    """
+    Deliver pending messages to every sink still owed them, all sinks concurrently. Fully delivered keys
+    move to `sent`; the rest stay pending for the next run until OUTBOX_MAX_ATTEMPTS. Returns deliveries made.
+    """
+    sinks = configured_sinks()
+    if not sinks:
+        return 0
+    if _outbox_conflict.is_set():
+        logger.warning("Outbox was taken over by another run; not delivering from this one")
+        return 0
+    names = [sink.name for sink in sinks]
+    with _outbox_lock:
+        for m in _outbox["pending"]:
+            # Entries from before sinks existed are owed to everyone; dropped destinations are owed nothing.
+            m["sinks"] = [name for name in m.get("sinks", names) if name in names]
+        owed = {name: [m for m in _outbox["pending"] if name in m["sinks"]] for name in names}
+    if not any(owed.values()):
+        return 0
+
+    delivered = sum(_fan_out(sinks, lambda sink: _drain_sink(sink, owed[sink.name]) if owed[sink.name] else 0))
+
+    now = time.time()
+    with _outbox_lock:
+        still_pending = []
+        for m in _outbox["pending"]:
+            if not m["sinks"]:
+                _outbox["sent"][m["key"]] = now
+                continue
+            if m.pop("failed", False):
+                m["attempts"] = m.get("attempts", 0) + 1
+            if m.get("attempts", 0) >= OUTBOX_MAX_ATTEMPTS:
+                logger.error("Dropping %s after %d attempts (undelivered to %s)", m["key"], m["attempts"], m["sinks"])
+                continue
+            still_pending.append(m)
+        _outbox["pending"] = still_pending
+    return delivered
+
+# -----------------------
+# Pipelines (plots / newsletters), each isolated from the other's failures
+# -----------------------
+def run_plots_pipeline(store: StateBackend, fetch, unit: str = DEFAULT_UNIT) -> dict:
+    """
+    `fetch() -> all_plots` for one unit; diff against its state (added / relisted / modified / removed),
+    save with lifecycle fields, notify. Never raises.
+    """
+    state_key = unit_state_key(unit)
     all_plots = []
     new_plots = []
-    news_now = []
-    new_news = []
-    
-    # ====== PLOTS ======
+    relisted_plots = []
+    modified_plots = []
+    removed_plots = []
+    result = {}
     try:
-        logger.info("Starting plot parsing...")
-        summary = fetch_unit_wise_summary(session)
+        logger.info(f"Starting plot parsing for {unit}...")
         try:
-            detail_link = extract_uit_alwar_link(summary)
-            schemes = fetch_scheme_list(session, detail_link)
-
-            for s in schemes:
-                if not s.get("href"):
-                    continue
-                plots = fetch_plot_details(session, s["href"])
-                for p in plots:
-                    p.setdefault("scheme_name", s.get("scheme_name"))
-                    # If no detail_url captured from LI, fallback to scheme page (at least something clickable)
-                    p.setdefault("detail_url", s.get("href"))
-                all_plots.extend(plots)
-
-            prev_plots = load_json(s3, OBJECT_KEY)
-            prev_ids = {x.get("id") for x in prev_plots if x.get("id")}
-            new_plots = [p for p in all_plots if p.get("id") and p["id"] not in prev_ids]
-            save_json(s3, OBJECT_KEY, all_plots)
+            all_plots = fetch()
+            now = time.time()
+            plot_store = store.plot_store()
+            if _pages_unchanged(SUMMARY_URL):
+                logger.info(f"Auction pages not modified since last run; skipping plot diff for {unit}")
+                if plot_store is None:
+                    mark_plot_run(store, state_key, now)
+            else:
+                if plot_store is None:
+                    prev_plots = [Plot.from_state(d) for d in load_state(store, state_key)]
+                    diff = diff_plots(prev_plots, all_plots)
+                else:
+                    if not plot_store.has_unit(unit):
+                        # First run on the plot store: seed it from the unit's state document, if any.
+                        plot_store.upsert(unit, [Plot.from_state(d) for d in load_json(store, state_key)])
+                    diff = plot_store.diff(unit, all_plots)
+                new_plots = diff["added"]
+                relisted_plots = diff["relisted"]
+                modified_plots = diff["modified"]
+                removed_plots = diff["removed"]
+                # Outbox first: if the state write or the send fails, the alerts are still owed.
+                queued = enqueue_notifications(new_plots, functools.partial(_build_plot_message_html, unit=unit), f"plot:{unit}")
+                queued += enqueue_notifications(
+                    relisted_plots,
+                    functools.partial(_build_plot_relisted_message_html, unit=unit),
+                    f"plot-relisted:{unit}",
+                    key_of=lambda m: f"{m['plot'].id}#{m['relisted']}",
+                )
+                # Keyed by the new fingerprint, so a re-detected change notifies once; a newer change
+                # forgets the plot's earlier keys, so a value that returns later is announced again.
+                change_key = lambda m: f"{m['plot'].id}@{m['fp']}"
+                forget_superseded([f"plot-change:{unit}:{change_key(m)}" for m in modified_plots])
+                queued += enqueue_notifications(
+                    modified_plots,
+                    functools.partial(_build_plot_change_message_html, unit=unit),
+                    f"plot-change:{unit}",
+                    key_of=change_key,
+                )
+                if queued:
+                    save_outbox(store)
+                if plot_store is None:
+                    next_state = next_plot_state(prev_plots, all_plots, now, last_plot_run(store, state_key))
+                    save_state(store, state_key, [p.to_state() for p in next_state])
+                    mark_plot_run(store, state_key, now)
+                else:
+                    plot_store.upsert(unit, all_plots, seen_at=now)
+                    plot_store.retire(unit, now)
             
+            if removed_plots:
+                logger.info(f"{len(removed_plots)} {unit} plots no longer listed")
+            if relisted_plots:
+                logger.info(f"Queued notifications for {len(relisted_plots)} relisted {unit} plots")
+            if modified_plots:
+                logger.info(f"Queued notifications for {len(modified_plots)} modified {unit} plots")
             if new_plots:
-                send_telegram_messages(new_plots, _build_plot_message_html)
-                logger.info(f"Sent notifications for {len(new_plots)} new plots")
-            else:
+                logger.info(f"Queued notifications for {len(new_plots)} new {unit} plots")
+            if not (new_plots or relisted_plots or modified_plots):
                 today = datetime.date.today().strftime("%d-%m-%Y")
-                send_telegram_message(f"ℹ️ No new plots found today ({today}).")
+                broadcast(f"ℹ️ No new {unit} plots found today ({today}).")
                 
-        except ValueError as e:
-            # Handle case where UIT, Alwar is not found
-            logger.warning(f"UIT, Alwar not found in current auctions: {e}")
+        except UnitNotFound as e:
+            # Only the unit lookup: any other error (state, diff) must fall through and forget the cached pages
+            logger.warning(f"{unit} not found in current auctions: {e}")
             today = datetime.date.today().strftime("%d-%m-%Y")
-            send_telegram_message(f"⚠️ UIT, Alwar not found in current auctions ({today}). {str(e)}")
+            broadcast(f"⚠️ {unit} not found in current auctions ({today}). {str(e)}")
             # Keep all_plots and new_plots as empty lists
             
     except Exception as e:
-        logger.exception("Plot parsing failed")
+        logger.exception(f"Plot parsing failed for {unit}")
+        _forget_host(SUMMARY_URL)
+        result["plots_error"] = str(e)
         today = datetime.date.today().strftime("%d-%m-%Y")
-        send_telegram_message(f"❌ Plot parsing failed ({today}): {str(e)}")
+        broadcast(f"❌ {unit} plot parsing failed ({today}): {str(e)}")
+
+    result.update({
+        "total_plots": len(all_plots),
+        "new_plots": len(new_plots),
+        "relisted_plots": len(relisted_plots),
+        "modified_plots": len(modified_plots),
+        "removed_plots": len(removed_plots),
+    })
+    return result
 
-    # ====== NEWSLETTERS ======
+def run_news_pipeline(store: StateBackend, fetch) -> dict:
+    """
+    `fetch() -> news_now`; diff against S3 state, save, notify. Never raises.
+    """
+    news_now = []
+    new_news = []
+    result = {}
     try:
         logger.info("Starting newsletter parsing...")
-        news_now = fetch_newsletters(session)
-        prev_news = load_json(s3, OBJECT_KEY_NEWS)
-        prev_news_ids = {x.get("id") for x in prev_news if x.get("id")}
-        new_news = [n for n in news_now if n.get("id") and n["id"] not in prev_news_ids]
-        save_json(s3, OBJECT_KEY_NEWS, news_now)
+        news_now = fetch()
+        if _pages_unchanged(NEWS_URL):
+            logger.info("Newsletter page not modified since last run; skipping news diff")
+        else:
+            prev_news = load_state(store, OBJECT_KEY_NEWS)
+            prev_news_ids = {x.get("id") for x in prev_news if x.get("id")}
+            new_news = [n for n in news_now if n.id and n.id not in prev_news_ids]
+            if enqueue_notifications(new_news, _build_news_message_html, "news"):
+                save_outbox(store)
+            save_state(store, OBJECT_KEY_NEWS, [n.to_state() for n in news_now])
         
         if new_news:
-            send_telegram_messages(new_news, _build_news_message_html)
-            logger.info(f"Sent notifications for {len(new_news)} new newsletters")
+            logger.info(f"Queued notifications for {len(new_news)} new newsletters")
         else:
             today = datetime.date.today().strftime("%d-%m-%Y")
-            send_telegram_message(f"ℹ️ No new newsletters found today ({today}).")
+            broadcast(f"ℹ️ No new newsletters found today ({today}).")
             
     except Exception as e:
         logger.exception("Newsletter parsing failed")
+        _forget_host(NEWS_URL)
+        result["news_error"] = str(e)
+        today = datetime.date.today().strftime("%d-%m-%Y")
+        broadcast(f"❌ Newsletter parsing failed ({today}): {str(e)}")
+
+    result.update({"total_news": len(news_now), "new_news": len(new_news)})
+    return result
+
+def _combine_results(unit_results: list[dict], news: dict) -> dict:
+    return {
+        "total_plots": sum(r["total_plots"] for r in unit_results),
+        "new_plots": sum(r["new_plots"] for r in unit_results),
+        "relisted_plots": sum(r["relisted_plots"] for r in unit_results),
+        "modified_plots": sum(r["modified_plots"] for r in unit_results),
+        "units": dict(zip(MONITOR_UNITS, unit_results)),
+        **news,
+    }
+
+def _run_pipelines(store: StateBackend) -> dict:
+    """
+    Sync engine: the summary is fetched once; every unit's pipeline and the news pipeline
+    run on their own thread, sharing one pooled session.
+    """
+    session = http_session()
+    with ThreadPoolExecutor(max_workers=len(MONITOR_UNITS) + 2, thread_name_prefix="pipeline") as pool:
+        index = pool.submit(fetch_unit_index, session)
+
+        def crawl(unit: str) -> list[Plot]:
+            return crawl_unit_plots(session, index.result(), unit)
+
+        units = [
+            pool.submit(run_plots_pipeline, store, functools.partial(crawl, unit), unit)
+            for unit in MONITOR_UNITS
+        ]
+        news = pool.submit(run_news_pipeline, store, lambda: fetch_newsletters(session))
+        return _combine_results([u.result() for u in units], news.result())
+
+async def _arun_pipelines(store: StateBackend) -> dict:
+    """
+    Async engine: all units' crawls and the news fetch overlap in one event loop; the blocking
+    S3/Telegram tail of each pipeline runs in a worker thread.
+    """
+    import asyncio
+
+    async def pipeline(run, fetch_coro, *args):
+        fetched = (await asyncio.gather(fetch_coro, return_exceptions=True))[0]
+        return await asyncio.to_thread(run, store, lambda: _unwrap(fetched), *args)
+
+    async with new_async_client() as client:
+        index_task = asyncio.ensure_future(afetch_unit_index(client))
+        *units, news = await asyncio.gather(
+            *(pipeline(run_plots_pipeline, acrawl_unit_plots(client, index_task, unit), unit) for unit in MONITOR_UNITS),
+            pipeline(run_news_pipeline, afetch_newsletters(client)),
+        )
+    return _combine_results(units, news)
+
+# -----------------------
+# Main handler
+# -----------------------
+def lambda_handler(event, context):
+    if not (STATE_URI or BUCKET_NAME):
+        logger.error("Missing BUCKET_NAME")
+        return {"statusCode": 500, "body": "Missing BUCKET_NAME"}
+
+    started = time.perf_counter()
+    warm = "state" in _clients
+    store = state_backend()
+    logger.info("%r %s in %.1f ms", store, "reused" if warm else "created", (time.perf_counter() - started) * 1000)
+    load_http_cache(store)
+    try:
+        load_outbox(store)
+    except Exception as e:
+        # Without the outbox, pending alerts and delivered keys would be overwritten: stop before crawling.
+        logger.exception("Could not load the outbox")
         today = datetime.date.today().strftime("%d-%m-%Y")
-        send_telegram_message(f"❌ Newsletter parsing failed ({today}): {str(e)}")
+        broadcast(f"❌ Could not load the notification outbox ({today}): {str(e)}")
+        return {"statusCode": 500, "body": f"Could not load outbox: {e}"}
+
+    if HTTP_ENGINE == "async":
+        import asyncio
+
+        body = asyncio.run(_arun_pipelines(store))
+    else:
+        body = _run_pipelines(store)
+
+    try:
+        body["notified"] = drain_outbox()
+    finally:
+        try:
+            save_outbox(store)
+        except Exception as e:
+            logger.exception("Could not save the outbox")
+            body["outbox_error"] = str(e)
+            today = datetime.date.today().strftime("%d-%m-%Y")
+            broadcast(f"❌ Could not save the notification outbox ({today}): {str(e)}")
+        save_http_cache(store)
 
     return {
         "statusCode": 200,
-        "body": json.dumps({
-            "total_plots": len(all_plots),
-            "new_plots": len(new_plots),
-            "total_news": len(news_now),
-            "new_news": len(new_news),
-        })
+        "body": json.dumps(body),
     }
 
+# -----------------------
+# Cold-start import budget
+# -----------------------
+def check_import_budget(budget_ms: float = IMPORT_BUDGET_MS, runs: int = 3) -> bool:
+    """
+    Import this module in `runs` fresh interpreters under `python -X importtime` and compare the
+    best cumulative import time against `budget_ms`. Guards the lazy-import structure above.
+    """
+    import subprocess
+    import sys
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    name = os.path.splitext(os.path.basename(__file__))[0]
+    best_us = None
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {name}"],
+            cwd=here, capture_output=True, text=True, check=True,
+        )
+        # Lines look like "import time:  self [us] | cumulative | imported package"
+        for line in proc.stderr.splitlines():
+            parts = line.split("|")
+            if len(parts) == 3 and parts[2].strip() == name:
+                us = int(parts[1])
+                best_us = us if best_us is None else min(best_us, us)
+    if best_us is None:
+        logger.error("Could not find %s in -X importtime output", name)
+        return False
+
+    took_ms = best_us / 1000.0
+    ok = took_ms <= budget_ms
+    (logger.info if ok else logger.error)("Cold import of %s: %.1f ms (budget %.1f ms)", name, took_ms, budget_ms)
+    return ok
+
 # -----------------------
 # Allow running via `python lambda_function.py`
 # -----------------------
 if __name__ == "__main__":
     import sys
+    if sys.argv[1:] == ["--import-budget"]:
+        sys.exit(0 if check_import_budget() else 1)
+    if sys.argv[1:2] == ["--state-at"] and len(sys.argv) == 4:
+        at = datetime.datetime.fromisoformat(sys.argv[3]).timestamp()
+        print(json.dumps(state_at(state_backend(), sys.argv[2], at), ensure_ascii=False, indent=2))
+        sys.exit(0)
     try:
         res = lambda_handler({}, {})
         print("[Runner] lambda_handler() returned:", res)
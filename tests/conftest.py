@@ -0,0 +1,60 @@
+import os
+import sys
+
+import pytest
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import lambda_function as lf  # noqa: E402
+
+
+class StubSink(lf.Sink):
+    """Records what it is sent; any text containing one of `reject` is refused with `status`."""
+
+    def __init__(self, name: str = "stub", reject: tuple[str, ...] = (), status: int = 400):
+        super().__init__(name, lf.TokenBucket(1000))
+        self.sent: list[str] = []
+        self.reject = reject
+        self.status = status
+
+    def send(self, text: str) -> None:
+        if any(bad in text for bad in self.reject):
+            resp = requests.Response()
+            resp.status_code = self.status
+            raise requests.HTTPError(f"{self.status} rejected", response=resp)
+        self.sent.append(text)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_module_state(monkeypatch):
+    """Every test starts with an empty HTTP cache, outbox and client cache, and sends nothing for real."""
+    lf._http_cache.clear()
+    lf._http_fresh.clear()
+    lf._clients.pop("state", None)
+    lf._outbox_conflict.clear()
+    monkeypatch.setitem(lf._outbox, "pending", [])
+    monkeypatch.setitem(lf._outbox, "sent", {})
+    monkeypatch.setattr(lf, "configured_sinks", lambda: [])
+    yield
+    lf._http_cache.clear()
+    lf._http_fresh.clear()
+    lf._clients.pop("state", None)
+    lf._outbox_conflict.clear()
+
+
+@pytest.fixture
+def store(tmp_path):
+    return lf.LocalBackend(str(tmp_path / "state"))
+
+
+@pytest.fixture
+def sinks(monkeypatch):
+    """Install stub sinks: `sinks(StubSink("a"), ...)` -> the list configured_sinks() returns."""
+
+    def install(*stubs: StubSink) -> list[StubSink]:
+        installed = list(stubs) or [StubSink()]
+        monkeypatch.setattr(lf, "configured_sinks", lambda: installed)
+        return installed
+
+    return install
@@ -0,0 +1,112 @@
+import pytest
+
+import lambda_function as lf
+
+KEY = "plots.json"
+
+
+def _kinds(store) -> list[str]:
+    return [kind for _, kind, _ in lf.ChangeLog(store, KEY)._entries()]
+
+
+def _rec(rid: str, **kw) -> dict:
+    return {"id": rid, "title": f"Plot {rid}", **kw}
+
+
+def _by_id(records: list[dict]) -> dict:
+    return {r["id"]: r for r in records}
+
+
+@pytest.fixture(autouse=True)
+def _log_layout(monkeypatch):
+    monkeypatch.setattr(lf, "STATE_LAYOUT", "log")
+    monkeypatch.setattr(lf, "STATE_COMPACT_EVERY", 3)
+
+
+def test_replay_and_state_at(store):
+    runs = [
+        (100.0, [_rec("A"), _rec("B")]),
+        (200.0, [_rec("A", bid_end="x"), _rec("B")]),
+        (300.0, [_rec("A", bid_end="x"), _rec("C")]),
+    ]
+    log = lf.ChangeLog(store, KEY)
+    log.load()
+    for at, records in runs:
+        assert log.append(records, at=at)
+
+    assert _by_id(lf.ChangeLog(store, KEY).load()) == _by_id(runs[-1][1])
+    for at, records in runs:
+        assert _by_id(lf.state_at(store, KEY, at)) == _by_id(records)
+        assert _by_id(lf.state_at(store, KEY, at + 50)) == _by_id(records)
+    assert lf.state_at(store, KEY, 99.0) == []
+
+
+def test_entries_hold_only_the_changes(store):
+    log = lf.ChangeLog(store, KEY)
+    log.append([_rec("A"), _rec("B")], at=100.0)
+    log.append([_rec("A", bid_end="x"), _rec("C")], at=200.0)
+    (_, kind, key) = lf.ChangeLog(store, KEY)._entries()[-1]
+    assert kind == "log"
+    assert store.load(key) == {"at": 200.0, "upsert": [_rec("A", bid_end="x"), _rec("C")], "delete": ["B"]}
+
+
+def test_unchanged_run_writes_nothing(store):
+    log = lf.ChangeLog(store, KEY)
+    log.append([_rec("A")], at=100.0)
+    assert not log.append([_rec("A")], at=200.0)
+    assert not lf.ChangeLog(store, KEY).append([_rec("A")], at=300.0)
+    assert _kinds(store) == ["snapshot"]
+
+
+def test_compaction_every_n_entries(store):
+    log = lf.ChangeLog(store, KEY)
+    history = []
+    for i in range(7):
+        records = [_rec(str(j)) for j in range(i + 1)]
+        history.append((100.0 * (i + 1), records))
+        log.append(records, at=100.0 * (i + 1))
+    # The first write is a snapshot; then every STATE_COMPACT_EVERY-th entry is one.
+    assert _kinds(store) == ["snapshot", "log", "log", "snapshot", "log", "log", "snapshot"]
+    for at, records in history:
+        assert _by_id(lf.state_at(store, KEY, at)) == _by_id(records)
+
+    # A fresh reader continues the count from the latest snapshot.
+    log = lf.ChangeLog(store, KEY)
+    log.load()
+    log.append([_rec("x")], at=800.0)
+    log.append([_rec("y")], at=900.0)
+    lf.ChangeLog(store, KEY).append([_rec("z")], at=1000.0)
+    assert _kinds(store)[7:] == ["log", "log", "snapshot"]
+
+
+def test_snapshot_sorts_after_log_entry_of_same_millisecond(store):
+    prefix = lf._history_prefix(KEY)
+    store.create(f"{prefix}snapshot-{lf._ms(100.0)}-000000.json", [_rec("A")])
+    store.create(f"{prefix}log-{lf._ms(200.0)}-ffffff.json", {"at": 200.0, "upsert": [_rec("A", v=1)], "delete": []})
+    # Same millisecond: the snapshot already contains this log entry's change (v=2 came later in that run).
+    store.create(f"{prefix}snapshot-{lf._ms(200.0)}-000000.json", [_rec("A", v=2)])
+    assert _kinds(store) == ["snapshot", "log", "snapshot"]
+    assert lf.ChangeLog(store, KEY).load() == [_rec("A", v=2)]
+    assert lf.state_at(store, KEY, 200.0) == [_rec("A", v=2)]
+
+
+def test_migrates_from_state_document(store):
+    lf.save_json(store, KEY, [_rec("A"), _rec("B")])
+    log = lf.ChangeLog(store, KEY)
+    assert _by_id(log.load()) == _by_id([_rec("A"), _rec("B")])
+    # The first append writes a full snapshot even when nothing changed, so the log stands on its own.
+    assert log.append([_rec("A"), _rec("B")], at=100.0)
+    assert _kinds(store) == ["snapshot"]
+
+    lf.save_json(store, KEY, [_rec("stale")])
+    assert _by_id(lf.ChangeLog(store, KEY).load()) == _by_id([_rec("A"), _rec("B")])
+    # History starts at the migration; the document itself is not part of it.
+    assert lf.state_at(store, KEY, 50.0) == []
+
+
+def test_document_layout(store, monkeypatch):
+    monkeypatch.setattr(lf, "STATE_LAYOUT", "document")
+    lf.save_state(store, KEY, [_rec("A")])
+    assert lf.load_json(store, KEY) == [_rec("A")]
+    assert lf.load_state(store, KEY) == [_rec("A")]
+    assert _kinds(store) == []
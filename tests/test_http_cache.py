@@ -0,0 +1,65 @@
+import time
+
+import pytest
+import requests
+
+import lambda_function as lf
+
+SCHEME = {"scheme_name": "S1", "href": "https://example.test/scheme/1", "count": "2"}
+CACHED = [{"id": "A"}, {"id": "B"}]
+
+
+class NotModifiedSession:
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.calls += 1
+        resp = requests.Response()
+        resp.status_code = 304
+        return resp
+
+
+def _cache_scheme(checked_hours_ago: float) -> dict:
+    entry = {"etag": '"v1"', "hash": "h", "result": CACHED, "count": "2",
+             "checked_at": time.time() - checked_hours_ago * 3600}
+    lf._http_cache[SCHEME["href"]] = entry
+    return entry
+
+
+def _revalidate(session) -> list[lf.Plot]:
+    return lf.fetch_plot_details(session, SCHEME["href"])
+
+
+def test_revalidation_renews_the_refresh_window(monkeypatch):
+    monkeypatch.setattr(lf, "SCHEME_REFRESH_HOURS", 4)
+    _cache_scheme(checked_hours_ago=5)
+    assert lf._unchanged_scheme_plots(SCHEME) is None
+
+    session = NotModifiedSession()
+    assert [p.id for p in _revalidate(session)] == ["A", "B"]
+    assert [p.id for p in lf._unchanged_scheme_plots(SCHEME)] == ["A", "B"]
+
+
+def test_recent_check_leaves_the_entry_untouched(monkeypatch):
+    monkeypatch.setattr(lf, "SCHEME_REFRESH_HOURS", 4)
+    entry = _cache_scheme(checked_hours_ago=0.5)
+    before = dict(entry)
+    _revalidate(NotModifiedSession())
+    assert entry == before
+
+
+@pytest.mark.parametrize("hours", [0, 4])
+def test_count_change_always_refetches(monkeypatch, hours):
+    monkeypatch.setattr(lf, "SCHEME_REFRESH_HOURS", hours)
+    _cache_scheme(checked_hours_ago=0)
+    assert lf._unchanged_scheme_plots({**SCHEME, "count": "3"}) is None
+
+
+def test_skip_off_by_default(monkeypatch):
+    monkeypatch.setattr(lf, "SCHEME_REFRESH_HOURS", 0)
+    entry = _cache_scheme(checked_hours_ago=100)
+    before = dict(entry)
+    assert lf._unchanged_scheme_plots(SCHEME) is None
+    _revalidate(NotModifiedSession())
+    assert entry == before
@@ -0,0 +1,133 @@
+import pytest
+
+import lambda_function as lf
+from conftest import StubSink
+
+
+def _item(i: int, text: str | None = None) -> lf.Newsletter:
+    return lf.Newsletter(id=f"n{i}", title=text or f"Notice {i}")
+
+
+def _build(n: lf.Newsletter) -> str:
+    return f"<b>{n.title}</b>"
+
+
+# -----------------------
+# _pack_groups
+# -----------------------
+def test_pack_groups_fills_up_to_the_limit():
+    # 4 + 2 + 4 = 10 fits exactly; one more char does not.
+    assert lf._pack_groups(["aaaa", "bbbb", "cc"], limit=10) == [[0, 1], [2]]
+    assert lf._pack_groups(["aaaa", "bbbb"], limit=10) == [[0, 1]]
+    assert lf._pack_groups(["aaaa", "bbbbb"], limit=10) == [[0], [1]]
+
+
+def test_pack_groups_sends_an_oversized_item_alone():
+    assert lf._pack_groups(["a", "x" * 20, "b", "c"], limit=10) == [[0], [1], [2, 3]]
+    assert lf._pack_groups(["x" * 20], limit=10) == [[0]]
+
+
+def test_pack_groups_counts_utf16_units():
+    # Each emoji is 2 UTF-16 units: 4 + 2 (sep) + 4 = 10.
+    assert lf._tg_len("🏗️") == 3 and lf._tg_len("😀😀") == 4
+    assert lf._pack_groups(["😀😀", "😀😀"], limit=10) == [[0, 1]]
+    assert lf._pack_groups(["😀😀", "😀😀"], limit=9) == [[0], [1]]
+
+
+def test_pack_groups_empty():
+    assert lf._pack_groups([]) == []
+
+
+# -----------------------
+# digest delivery
+# -----------------------
+@pytest.mark.parametrize("status, resent_alone", [(400, True), (500, False), (429, False)])
+def test_rejected_digest_is_resent_item_by_item(sinks, monkeypatch, status, resent_alone):
+    monkeypatch.setattr(lf, "TELEGRAM_DIGEST", True)
+    (sink,) = sinks(StubSink(reject=("a < b",), status=status))
+    lf.enqueue_notifications([_item(1), _item(2, "a < b"), _item(3)], _build, "news")
+
+    delivered = lf.drain_outbox()
+    (left,) = [m for m in lf._outbox["pending"] if m["key"] == "news:n2"]
+    assert left["attempts"] == 1
+    if resent_alone:
+        assert delivered == 2 and sink.sent == ["<b>Notice 1</b>", "<b>Notice 3</b>"]
+        assert len(lf._outbox["pending"]) == 1
+    else:
+        # Server or rate-limit errors are not the item's fault: the whole digest is retried next run.
+        assert delivered == 0 and sink.sent == []
+        assert all(m["attempts"] == 1 for m in lf._outbox["pending"]) and len(lf._outbox["pending"]) == 3
+
+
+# -----------------------
+# enqueue / drain
+# -----------------------
+def test_enqueue_is_idempotent(sinks):
+    sinks(StubSink("a"), StubSink("b"))
+    assert lf.enqueue_notifications([_item(1), _item(2)], _build, "news") == 2
+    assert lf.enqueue_notifications([_item(1), _item(2), _item(3)], _build, "news") == 1
+    assert [m["key"] for m in lf._outbox["pending"]] == ["news:n1", "news:n2", "news:n3"]
+    assert lf._outbox["pending"][0]["sinks"] == ["a", "b"]
+
+    lf.drain_outbox()
+    assert lf._outbox["pending"] == []
+    # Delivered keys are remembered: re-detected items are not queued again.
+    assert lf.enqueue_notifications([_item(1)], _build, "news") == 0
+
+
+def test_no_sinks_queues_nothing():
+    assert lf.enqueue_notifications([_item(1)], _build, "news") == 0
+    assert lf._outbox["pending"] == []
+
+
+def test_each_sink_keeps_its_own_remainder(sinks):
+    ok, flaky = sinks(StubSink("ok"), StubSink("flaky", reject=("Notice 2",), status=500))
+    lf.enqueue_notifications([_item(1), _item(2)], _build, "news")
+
+    assert lf.drain_outbox() == 3
+    assert ok.sent == ["<b>Notice 1</b>", "<b>Notice 2</b>"] and flaky.sent == ["<b>Notice 1</b>"]
+    (left,) = lf._outbox["pending"]
+    assert left["key"] == "news:n2" and left["sinks"] == ["flaky"] and left["attempts"] == 1
+    assert "news:n1" in lf._outbox["sent"]
+
+    flaky.reject = ()
+    assert lf.drain_outbox() == 1
+    assert ok.sent == ["<b>Notice 1</b>", "<b>Notice 2</b>"]
+    assert lf._outbox["pending"] == [] and "news:n2" in lf._outbox["sent"]
+
+
+def test_cap_leaves_the_rest_queued(sinks, monkeypatch):
+    monkeypatch.setattr(lf, "TELEGRAM_MAX_MESSAGES", 2)
+    (sink,) = sinks()
+    lf.enqueue_notifications([_item(i) for i in range(5)], _build, "news")
+
+    assert lf.drain_outbox() == 2
+    assert [m["key"] for m in lf._outbox["pending"]] == ["news:n2", "news:n3", "news:n4"]
+    assert all(m["attempts"] == 0 for m in lf._outbox["pending"])
+    assert lf.drain_outbox() == 2 and lf.drain_outbox() == 1
+    assert len(sink.sent) == 5
+
+
+def test_dropped_after_max_attempts(sinks, monkeypatch):
+    monkeypatch.setattr(lf, "OUTBOX_MAX_ATTEMPTS", 3)
+    sinks(StubSink(reject=("Notice 1",), status=500))
+    lf.enqueue_notifications([_item(1)], _build, "news")
+
+    for attempts in (1, 2):
+        lf.drain_outbox()
+        assert lf._outbox["pending"][0]["attempts"] == attempts
+    lf.drain_outbox()
+    assert lf._outbox["pending"] == [] and "news:n1" not in lf._outbox["sent"]
+
+
+def test_outbox_round_trip_forgets_old_sent_keys(store, sinks, monkeypatch):
+    monkeypatch.setattr(lf, "OUTBOX_SENT_TTL_DAYS", 1)
+    sinks()
+    lf.enqueue_notifications([_item(1)], _build, "news")
+    lf._outbox["sent"].update({"news:recent": lf.time.time(), "news:old": lf.time.time() - 2 * 86400})
+    lf.save_outbox(store)
+
+    lf._outbox["pending"], lf._outbox["sent"] = [], {}
+    lf.load_outbox(lf.LocalBackend(store.directory))
+    assert [m["key"] for m in lf._outbox["pending"]] == ["news:n1"]
+    assert set(lf._outbox["sent"]) == {"news:recent"}
@@ -0,0 +1,126 @@
+"""
+HTML_PARSER parity: every page parser must give the same result with the stdlib "html.parser"
+and with lxml, and the SoupStrainer-restricted parse must match a full-tree parse.
+The fixtures under tests/fixtures/ mirror the markup of the live pages.
+"""
+from pathlib import Path
+
+import pytest
+import requests
+
+import lambda_function as lf
+
+FIXTURES = Path(__file__).parent / "fixtures"
+PARSERS = ["html.parser", "lxml"]
+
+DETAIL_URL = f"{lf.BASE_URL}/Portal/AuctionListNew/Detail?unit=UITALW&type=live"
+SCHEME_URL = f"{lf.BASE_URL}/Portal/AuctionListNew/Scheme?unit=UITALW&scheme=101"
+
+
+def _page(name: str) -> bytes:
+    return (FIXTURES / name).read_bytes()
+
+
+class FixtureSession:
+    """Stands in for requests.Session: every GET answers 200 with the same fixture page."""
+
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        resp = requests.Response()
+        resp.status_code = 200
+        resp._content = self.body
+        resp.encoding = "utf-8"
+        resp.url = url
+        return resp
+
+
+@pytest.fixture
+def use_parser(monkeypatch):
+    def use(name: str) -> None:
+        if name == "lxml":
+            pytest.importorskip("lxml")
+        monkeypatch.setattr(lf, "HTML_PARSER", name)
+        lf._html_parser.cache_clear()
+        # Start every fetch cold, otherwise the second parser would be served the first one's cached result.
+        lf._http_cache.clear()
+        lf._http_fresh.clear()
+
+    yield use
+    lf._html_parser.cache_clear()
+    lf._http_cache.clear()
+    lf._http_fresh.clear()
+
+
+def _by_parser(use_parser, fetch):
+    results = {}
+    for name in PARSERS:
+        use_parser(name)
+        assert lf._html_parser() == name
+        results[name] = fetch()
+    return results
+
+
+def test_extract_uit_alwar_link(use_parser):
+    body = _page("summary.html")
+    results = _by_parser(
+        use_parser, lambda: lf.extract_uit_alwar_link(lf._make_soup(body.decode(), lf._ONLY_SUMMARY))
+    )
+    assert results["html.parser"] == results["lxml"]
+    assert results["lxml"] == f"{lf.BASE_URL}/Portal/AuctionListNew/Detail?unit=UITALW&type=live"
+
+
+def test_unit_index(use_parser):
+    session = FixtureSession(_page("summary.html"))
+    results = _by_parser(use_parser, lambda: lf.fetch_unit_index(session))
+    assert results["html.parser"] == results["lxml"]
+    assert lf.find_unit(results["lxml"], "UIT, Bhiwadi")["href"].endswith("unit=UITBHW&type=live")
+    assert lf.find_unit(results["lxml"], "JDA, Jaipur")["cells"][1] == "JDA, Jaipur"
+
+
+def test_fetch_scheme_list(use_parser):
+    session = FixtureSession(_page("unit_detail.html"))
+    results = _by_parser(use_parser, lambda: lf.fetch_scheme_list(session, DETAIL_URL))
+    assert results["html.parser"] == results["lxml"]
+    assert [s["count"] for s in results["lxml"]] == ["3", "2", "0", "1"]
+    assert results["lxml"][2]["href"] is None
+
+
+def test_fetch_plot_details(use_parser):
+    session = FixtureSession(_page("scheme.html"))
+    results = _by_parser(use_parser, lambda: lf.fetch_plot_details(session, SCHEME_URL))
+    assert results["html.parser"] == results["lxml"]
+    plots = [p for p in results["lxml"] if p.id]  # links before the first "Id :" form an id-less record
+    assert [p.id for p in plots] == ["UITALW-2026-0101", "UITALW-2026-0102", "UITALW-2026-0103"]
+    assert plots[0].emd_amount == "1,50,000" and plots[0].assessed_value == "30,10,000"
+    assert plots[1].title == "Corner Plot & Park Facing"
+    assert plots[1].detail_url.endswith("AuctionDetail?id=UITALW-2026-0102")
+    assert plots[2].usage_type == "Commercial" and plots[2].bid_end == ""
+
+
+def test_fetch_newsletters(use_parser, monkeypatch):
+    monkeypatch.setattr(lf, "NEWS_URL", "http://uitalwar.rajasthan.gov.in/Auction.aspx")
+    session = FixtureSession(_page("auction_news.html"))
+    results = _by_parser(use_parser, lambda: lf.fetch_newsletters(session))
+    assert results["html.parser"] == results["lxml"]
+    news = results["lxml"]
+    assert [n.title for n in news] == ["View", "Shops Notice", "View Document"]
+    assert news[0].url == "http://uitalwar.rajasthan.gov.in/Uploads/Auction/Notice_05112026.pdf"
+    assert news[2].url == ""
+
+
+@pytest.mark.parametrize("parser", PARSERS)
+@pytest.mark.parametrize(
+    "page, only, parse",
+    [
+        ("summary.html", lf._ONLY_SUMMARY, lf.build_unit_index),
+        ("unit_detail.html", lf._ONLY_SCHEMES, lambda soup: lf._parse_scheme_list(soup, DETAIL_URL)),
+        ("scheme.html", lf._ONLY_PLOTS, lambda soup: lf._parse_plot_details(soup, SCHEME_URL)),
+        ("auction_news.html", lf._ONLY_NEWS, lf._parse_newsletters),
+    ],
+)
+def test_strainer_matches_full_tree(use_parser, parser, page, only, parse):
+    use_parser(parser)
+    html = _page(page).decode()
+    assert parse(lf._make_soup(html, only)) == parse(lf._make_soup(html))
@@ -0,0 +1,89 @@
+import json
+
+import lambda_function as lf
+
+UNIT = lf.DEFAULT_UNIT
+
+
+def _plot(pid: str, **kw) -> lf.Plot:
+    return lf.Plot(id=pid, title=f"Plot {pid}", scheme_name="S1", **kw)
+
+
+def _pages_changed() -> None:
+    """What a run sees when the summary page came back with a new body."""
+    lf._http_fresh.clear()
+    lf._http_cache[lf.SUMMARY_URL] = {"hash": "h", "result": {}}
+    lf._http_fresh[lf.SUMMARY_URL] = True
+
+
+def _queued_keys() -> list[str]:
+    return [m["key"] for m in lf._outbox["pending"]]
+
+
+def test_state_error_is_not_reported_as_unit_not_found(store, sinks, monkeypatch):
+    sinks()
+    sent = []
+    monkeypatch.setattr(lf, "broadcast", sent.append)
+
+    _pages_changed()
+    assert lf.run_plots_pipeline(store, lambda: [_plot("A")], UNIT)["new_plots"] == 1
+
+    real_load_state = lf.load_state
+    calls = []
+
+    def truncated_once(*args):
+        calls.append(args)
+        if len(calls) == 1:
+            raise json.JSONDecodeError("Unterminated string", "{", 1)
+        return real_load_state(*args)
+
+    monkeypatch.setattr(lf, "load_state", truncated_once)
+    _pages_changed()
+    result = lf.run_plots_pipeline(store, lambda: [_plot("A"), _plot("B")], UNIT)
+    assert "plots_error" in result
+    assert not any("not found" in text for text in sent)
+    # The cached pages are forgotten, so the next run re-fetches and diffs instead of skipping.
+    assert lf.SUMMARY_URL not in lf._http_cache
+
+    _pages_changed()
+    assert lf.run_plots_pipeline(store, lambda: [_plot("A"), _plot("B")], UNIT)["new_plots"] == 1
+    assert f"plot:{UNIT}:B" in _queued_keys()
+
+
+def test_unit_not_found(store, monkeypatch):
+    sent = []
+    monkeypatch.setattr(lf, "broadcast", sent.append)
+
+    def fetch():
+        raise lf.UnitNotFound("UIT, Alwar row not found")
+
+    result = lf.run_plots_pipeline(store, fetch, UNIT)
+    assert "plots_error" not in result and result["total_plots"] == 0
+    assert any("not found in current auctions" in text for text in sent)
+
+
+def test_outbox_conflict_sends_nothing_and_still_saves_http_cache(store, sinks, monkeypatch, tmp_path):
+    sink, = sinks()
+    monkeypatch.setattr(lf, "broadcast", lambda text: None)
+    monkeypatch.setattr(lf, "STATE_URI", f"file://{tmp_path / 'state'}")
+    monkeypatch.setattr(lf, "state_backend", lambda: store)
+    store.save(lf.OBJECT_KEY_OUTBOX, {
+        "pending": [{"key": "news:old", "text": "old", "sinks": [sink.name], "created": 0, "attempts": 0}],
+        "sent": {},
+    })
+
+    def overlapping_run(store_):
+        # Another run writes the outbox between this run's load and its first save.
+        lf.LocalBackend(store.directory).save(lf.OBJECT_KEY_OUTBOX, {"pending": [], "sent": {"news:old": 1.0}})
+        lf._http_fresh[lf.NEWS_URL] = True
+        return lf.run_news_pipeline(store_, lambda: [lf.Newsletter(id="n1", title="New notice")])
+
+    monkeypatch.setattr(lf, "_run_pipelines", overlapping_run)
+    resp = lf.lambda_handler({}, {})
+
+    body = json.loads(resp["body"])
+    assert resp["statusCode"] == 200
+    assert "news_error" in body and "outbox_error" in body
+    assert body["notified"] == 0 and sink.sent == []
+    assert lf.load_json(lf.LocalBackend(store.directory), lf.OBJECT_KEY_OUTBOX)["sent"] == {"news:old": 1.0}
+    assert lf.load_json(lf.LocalBackend(store.directory), lf.OBJECT_KEY_HTTP_CACHE)["version"] == lf.HTTP_CACHE_VERSION
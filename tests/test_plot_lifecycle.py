@@ -0,0 +1,129 @@
+import lambda_function as lf
+
+UNIT = lf.DEFAULT_UNIT
+DAY = 86400
+
+
+def _plot(pid: str, **kw) -> lf.Plot:
+    return lf.Plot(**{"id": pid, "title": f"Plot {pid}", "bid_end": "10/01/2026 17:00", **kw})
+
+
+def _by_id(plots: list[lf.Plot]) -> dict[str, lf.Plot]:
+    return {p.id: p for p in plots}
+
+
+def test_delist_then_relist():
+    state = lf.next_plot_state([], [_plot("A"), _plot("B")], now=1 * DAY)
+    assert {p.id: (p.first_seen, p.relisted) for p in state} == {"A": (DAY, None), "B": (DAY, None)}
+
+    # B drops out: kept as a tombstone, not reported as removed twice.
+    diff = lf.diff_plots(state, [_plot("A")])
+    assert [p.id for p in diff["removed"]] == ["B"]
+    state = lf.next_plot_state(state, [_plot("A")], now=2 * DAY, last_run_at=1 * DAY)
+    b = _by_id(state)["B"]
+    assert (b.removed_at, b.last_seen, b.first_seen) == (2 * DAY, 1 * DAY, 1 * DAY)
+    assert lf.diff_plots(state, [_plot("A")])["removed"] == []
+
+    # B comes back: relisted (count 1), not added; first_seen survives.
+    diff = lf.diff_plots(state, [_plot("A"), _plot("B")])
+    assert diff["added"] == [] and diff["modified"] == []
+    (relisted,) = diff["relisted"]
+    assert (relisted["plot"].id, relisted["relisted"], relisted["removed_at"]) == ("B", 1, 2 * DAY)
+    state = lf.next_plot_state(state, [_plot("A"), _plot("B")], now=3 * DAY, last_run_at=2 * DAY)
+    b = _by_id(state)["B"]
+    assert (b.removed_at, b.relisted, b.first_seen) == (None, 1, 1 * DAY)
+
+    # And again: the count keeps going.
+    state = lf.next_plot_state(state, [_plot("A")], now=4 * DAY, last_run_at=3 * DAY)
+    assert lf.diff_plots(state, [_plot("A"), _plot("B")])["relisted"][0]["relisted"] == 2
+
+
+def test_tombstone_purged_past_horizon(monkeypatch):
+    monkeypatch.setattr(lf, "PLOT_TOMBSTONE_DAYS", 10)
+    state = lf.next_plot_state([], [_plot("A"), _plot("B")], now=1 * DAY)
+    state = lf.next_plot_state(state, [_plot("A")], now=2 * DAY, last_run_at=1 * DAY)
+
+    state = lf.next_plot_state(state, [_plot("A")], now=12 * DAY, last_run_at=2 * DAY)
+    assert "B" in _by_id(state)  # removed exactly 10 days ago: still kept
+    state = lf.next_plot_state(state, [_plot("A")], now=13 * DAY, last_run_at=12 * DAY)
+    assert list(_by_id(state)) == ["A"]
+    # Past the horizon it is a new plot again.
+    assert [p.id for p in lf.diff_plots(state, [_plot("A"), _plot("B")])["added"]] == ["B"]
+
+
+def test_modified_is_reported_with_field_deltas():
+    state = lf.next_plot_state([], [_plot("A")], now=DAY)
+    diff = lf.diff_plots(state, [_plot("A", bid_end="12/01/2026 17:00")])
+    (m,) = diff["modified"]
+    assert m["changes"] == {"bid_end": ["10/01/2026 17:00", "12/01/2026 17:00"]}
+    # Whitespace-only differences are not changes.
+    assert lf.diff_plots(state, [_plot("A", bid_end=" 10/01/2026  17:00 ")])["modified"] == []
+
+
+def test_relisted_alert_key_per_relisting(store, sinks, monkeypatch):
+    sinks()
+    monkeypatch.setattr(lf, "broadcast", lambda text: None)
+    clock = [0.0]
+    monkeypatch.setattr(lf.time, "time", lambda: clock[0])
+
+    def run(*ids):
+        clock[0] += DAY
+        lf._http_fresh.clear()
+        lf._http_fresh[lf.SUMMARY_URL] = True
+        return lf.run_plots_pipeline(store, lambda: [_plot(i) for i in ids], UNIT)
+
+    assert run("A", "B")["new_plots"] == 2
+    assert run("A")["removed_plots"] == 1
+    assert run("A", "B")["relisted_plots"] == 1
+    run("A")
+    assert run("A", "B")["relisted_plots"] == 1
+
+    keys = [m["key"] for m in lf._outbox["pending"]]
+    assert keys == [
+        f"plot:{UNIT}:A", f"plot:{UNIT}:B",
+        f"plot-relisted:{UNIT}:B#1", f"plot-relisted:{UNIT}:B#2",
+    ]
+
+
+def test_change_back_and_forth_is_announced_every_time(store, sinks, monkeypatch):
+    (sink,) = sinks()
+    monkeypatch.setattr(lf, "broadcast", lambda text: None)
+    clock = [0.0]
+    monkeypatch.setattr(lf.time, "time", lambda: clock[0])
+
+    def run(bid_end):
+        clock[0] += DAY
+        lf._http_fresh[lf.SUMMARY_URL] = True
+        result = lf.run_plots_pipeline(store, lambda: [_plot("A", bid_end=bid_end)], UNIT)
+        lf.drain_outbox()
+        return result["modified_plots"]
+
+    run("10/01/2026 17:00")
+    for bid_end in ("12/01/2026 17:00", "10/01/2026 17:00", "12/01/2026 17:00"):
+        assert run(bid_end) == 1
+    # One "new plot" alert, then all three changes.
+    assert len(sink.sent) == 4
+
+
+def test_redetected_change_is_not_sent_twice(store, sinks, monkeypatch):
+    (sink,) = sinks()
+    monkeypatch.setattr(lf, "broadcast", lambda text: None)
+    clock = [0.0]
+    monkeypatch.setattr(lf.time, "time", lambda: clock[0])
+    state_key = lf.unit_state_key(UNIT)
+
+    def run(bid_end):
+        clock[0] += DAY
+        lf._http_fresh[lf.SUMMARY_URL] = True
+        result = lf.run_plots_pipeline(store, lambda: [_plot("A", bid_end=bid_end)], UNIT)
+        lf.drain_outbox()
+        return result["modified_plots"]
+
+    run("10/01/2026 17:00")
+    before = lf.load_state(store, state_key)
+    assert run("12/01/2026 17:00") == 1
+    # The state write is lost after the alert went out: the next run detects the same change again.
+    clock[0] += 1
+    lf.save_state(store, state_key, before)
+    assert run("12/01/2026 17:00") == 1
+    assert sum("12/01/2026" in text for text in sink.sent) == 1
@@ -0,0 +1,110 @@
+import pytest
+
+import lambda_function as lf
+
+UNIT = lf.DEFAULT_UNIT
+DAY = 86400
+
+
+def _plot(pid: str, scheme: str = "S1", **kw) -> lf.Plot:
+    return lf.Plot(**{"id": pid, "title": f"Plot {pid}", "scheme_name": scheme, "bid_end": "10/01/2026 17:00", **kw})
+
+
+@pytest.fixture
+def plots(tmp_path):
+    return lf.SQLiteBackend(str(tmp_path / "state.db")).plot_store()
+
+
+def _ids(items) -> list[str]:
+    return sorted((x["plot"] if isinstance(x, dict) else x).id for x in items)
+
+
+def _row(plots, pid: str) -> tuple:
+    return plots.conn.execute(
+        "SELECT first_seen, last_seen, removed_at, relisted FROM plots WHERE unit = ? AND id = ?", (UNIT, pid)
+    ).fetchone()
+
+
+def test_added_modified_removed(plots):
+    plots.upsert(UNIT, [_plot("A"), _plot("B"), _plot("C")], seen_at=1 * DAY)
+    assert plots.has_unit(UNIT) and not plots.has_unit("UIT, Bhiwadi")
+
+    current = [_plot("A"), _plot("B", bid_end="12/01/2026 17:00"), _plot("D")]
+    diff = plots.diff(UNIT, current)
+    assert _ids(diff["added"]) == ["D"]
+    assert _ids(diff["removed"]) == ["C"]
+    assert diff["relisted"] == []
+    (modified,) = diff["modified"]
+    assert modified["plot"].id == "B" and modified["fp"] == lf.record_fingerprint(current[1])
+    assert modified["changes"] == {"bid_end": ["10/01/2026 17:00", "12/01/2026 17:00"]}
+    # Same answer as the document-state diff.
+    stored = [_plot("A"), _plot("B"), _plot("C")]
+    assert {k: _ids(v) for k, v in diff.items()} == {k: _ids(v) for k, v in lf.diff_plots(stored, current).items()}
+
+
+def test_unchanged_listing_diffs_empty(plots):
+    plots.upsert(UNIT, [_plot("A"), _plot("B")], seen_at=DAY)
+    assert plots.diff(UNIT, [_plot("B"), _plot("A")]) == {"added": [], "relisted": [], "modified": [], "removed": []}
+
+
+def test_units_are_separate(plots):
+    plots.upsert("UIT, Bhiwadi", [_plot("A")], seen_at=DAY)
+    assert _ids(plots.diff(UNIT, [_plot("A")])["added"]) == ["A"]
+
+
+def test_delist_relist_counts(plots):
+    plots.upsert(UNIT, [_plot("A"), _plot("B")], seen_at=1 * DAY)
+    plots.retire(UNIT, 1 * DAY)
+
+    # Run 2: B is gone -> tombstoned, not forgotten.
+    plots.upsert(UNIT, [_plot("A")], seen_at=2 * DAY)
+    plots.retire(UNIT, 2 * DAY)
+    assert _row(plots, "B") == (1 * DAY, 1 * DAY, 2 * DAY, 0)
+    assert plots.diff(UNIT, [_plot("A")])["removed"] == []
+
+    # Run 3: B is back -> relisted (not added), counter bumped on upsert.
+    diff = plots.diff(UNIT, [_plot("A"), _plot("B")])
+    assert diff["added"] == []
+    (relisted,) = diff["relisted"]
+    assert relisted["plot"].id == "B" and relisted["relisted"] == 1 and relisted["removed_at"] == 2 * DAY
+    plots.upsert(UNIT, [_plot("A"), _plot("B")], seen_at=3 * DAY)
+    plots.retire(UNIT, 3 * DAY)
+    assert _row(plots, "B") == (1 * DAY, 3 * DAY, None, 1)
+
+    # Delisted and relisted again: the count keeps going.
+    plots.upsert(UNIT, [_plot("A")], seen_at=4 * DAY)
+    plots.retire(UNIT, 4 * DAY)
+    assert plots.diff(UNIT, [_plot("A"), _plot("B")])["relisted"][0]["relisted"] == 2
+    plots.upsert(UNIT, [_plot("A"), _plot("B")], seen_at=5 * DAY)
+    assert _row(plots, "B")[2:] == (None, 2)
+
+
+def test_tombstones_purged_past_horizon(plots, monkeypatch):
+    monkeypatch.setattr(lf, "PLOT_TOMBSTONE_DAYS", 10)
+    plots.upsert(UNIT, [_plot("A"), _plot("B")], seen_at=1 * DAY)
+    plots.upsert(UNIT, [_plot("A")], seen_at=2 * DAY)
+    plots.retire(UNIT, 2 * DAY)
+
+    plots.upsert(UNIT, [_plot("A")], seen_at=12 * DAY)
+    plots.retire(UNIT, 12 * DAY)
+    assert _row(plots, "B") is not None  # removed exactly 10 days ago: still within the horizon
+
+    plots.upsert(UNIT, [_plot("A")], seen_at=13 * DAY)
+    plots.retire(UNIT, 13 * DAY)
+    assert _row(plots, "B") is None
+    # Past the horizon a returning ID is new again.
+    assert _ids(plots.diff(UNIT, [_plot("A"), _plot("B")])["added"]) == ["B"]
+
+
+def test_seeded_lifecycle_fields_are_kept(plots):
+    plots.upsert(UNIT, [_plot("A", first_seen=5.0, last_seen=6.0, removed_at=6.5, relisted=3)], seen_at=DAY)
+    assert _row(plots, "A") == (5.0, 6.0, 6.5, 3)
+
+
+def test_lookups(plots):
+    plots.upsert(UNIT, [_plot("B", "S1"), _plot("A", "S1"), _plot("C", "S2")], seen_at=DAY)
+    plots.upsert("UIT, Bhiwadi", [_plot("Z", "S1")], seen_at=DAY)
+    assert [p.id for p in plots.by_scheme(UNIT, "S1")] == ["A", "B"]
+    assert plots.get(UNIT, "C").scheme_name == "S2"
+    assert plots.get(UNIT, "Z") is None
+    assert plots.new_ids(UNIT, ["A", "X", "Z", "X"]) == {"X", "Z"}
@@ -0,0 +1,20 @@
+import pytest
+
+import lambda_function as lf
+
+
+@pytest.mark.parametrize(
+    "text, sqm",
+    [
+        ("150.50 Sq. Meter", 150.5),
+        ("100 Sq. Meter (Left side)", 100.0),
+        ("200 Sq. Yard", 167.23),
+        ("10 Sq.Yd", 8.36),
+        ("1,200 Sq. Ft.", 111.48),
+        ("1200sq.ft", 111.48),
+        ("300 Square Feet", 27.87),
+        ("", None),
+    ],
+)
+def test_parse_area(text, sqm):
+    assert lf._parse_area(text) == sqm
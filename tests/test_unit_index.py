@@ -0,0 +1,30 @@
+import pytest
+
+import lambda_function as lf
+
+
+def _index(rows: str) -> dict:
+    return lf.build_unit_index(lf._make_soup(f"<h3>Unit Wise Summary</h3><table>{rows}</table>", lf._ONLY_SUMMARY))
+
+
+def test_duplicate_unit_row_with_link_wins():
+    index = _index(
+        "<tr><td>1</td><td>UIT, Alwar</td><td>0</td></tr>"
+        '<tr><td>2</td><td>UIT, Alwar</td><td><a href="/detail/alwar">4</a></td></tr>'
+        '<tr><td>3</td><td>UIT, Alwar</td><td><a href="/detail/other">1</a></td></tr>'
+    )
+    assert lf.unit_link(index, "UIT, Alwar") == f"{lf.BASE_URL}/detail/alwar"
+
+
+def test_first_linked_row_is_kept():
+    index = _index(
+        '<tr><td>1</td><td>UIT,  Alwar</td><td><a href="/detail/first">4</a></td></tr>'
+        '<tr><td>2</td><td>UIT, Alwar</td><td><a href="/detail/second">1</a></td></tr>'
+    )
+    assert index["uit alwar"]["href"] == f"{lf.BASE_URL}/detail/first"
+
+
+def test_unit_without_link_is_not_found():
+    index = _index("<tr><td>1</td><td>UIT, Alwar</td><td>0</td></tr>")
+    with pytest.raises(lf.UnitNotFound):
+        lf.unit_link(index, "UIT, Alwar")